@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import sys
+from PySide6.QtGui import QPixmapCache
 from PySide6.QtWidgets import QApplication
 
 from studiohub.app.main_window import MainWindow
@@ -29,6 +30,9 @@ def main() -> int:
         
         app = QApplication(sys.argv)
         
+        # Shared pixmap cache for rendered icons (KB)
+        QPixmapCache.setCacheLimit(10_000)
+        
         # Fonts
         load_app_fonts()
         logger.debug("Fonts loaded")
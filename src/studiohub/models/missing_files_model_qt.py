@@ -31,7 +31,7 @@ class MissingFilesModelQt(QtCore.QObject):
     """
 
     scan_started = QtCore.Signal(str)            # source
-    scan_finished = QtCore.Signal(str, object)   # source, data
+    scan_finished = QtCore.Signal(str, object, int)   # source, data, revision
     scan_error = QtCore.Signal(str, str)         # source, message
 
     def __init__(self, config_manager: ConfigManager, parent: Optional[QtCore.QObject] = None):
@@ -39,6 +39,8 @@ class MissingFilesModelQt(QtCore.QObject):
         self.config_manager = config_manager
         self._cache_archive: Dict[str, Any] = {}
         self._cache_studio: Dict[str, Any] = {}
+        # Bumped whenever a source's cache is replaced; lets the view skip unchanged pushes
+        self._revision: Dict[str, int] = {"archive": 0, "studio": 0}
 
     # -------------------------------------------------
     # Cache access
@@ -70,6 +72,7 @@ class MissingFilesModelQt(QtCore.QObject):
                 # Check if data changed
                 if str(self._cache_archive) != str(new_data):
                     self._cache_archive = new_data
+                    self._revision[source] += 1
                     
             else:  # studio
                 new_data = self._build_studio_status(index)
@@ -77,10 +80,11 @@ class MissingFilesModelQt(QtCore.QObject):
                 # Check if data changed
                 if str(self._cache_studio) != str(new_data):
                     self._cache_studio = new_data
+                    self._revision[source] += 1
 
             # Emit the data from cache
             cache_data = self.get_cache(source)
-            self.scan_finished.emit(source, cache_data)
+            self.scan_finished.emit(source, cache_data, self._revision[source])
 
         except Exception as e:
             self.scan_error.emit(source, str(e))
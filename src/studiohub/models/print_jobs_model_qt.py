@@ -43,6 +43,22 @@ ROLE_JOB = Qt.UserRole
 ROLE_IS_FAILED = Qt.UserRole + 1
 
 
+# =====================================================
+# Planned Length (inches of roll paper per job)
+# =====================================================
+
+# 2-up always uses a 24" sheet; otherwise the print size decides
+_PLANNED_LENGTH_BY_MODE = {"2up": 24.0}
+_PLANNED_LENGTH_BY_SIZE = {"12x18": 18.0, "18x24": 24.0, "24x36": 36.0}
+
+
+def planned_length_for(job: PrintJobRecord) -> float:
+    return (
+        _PLANNED_LENGTH_BY_MODE.get((job.mode or "").lower())
+        or _PLANNED_LENGTH_BY_SIZE.get(job.size, 0.0)
+    )
+
+
 # =====================================================
 # Print Jobs Table Model
 # =====================================================
@@ -75,6 +91,7 @@ class PrintJobsModelQt(QtCore.QAbstractTableModel):
         self._rows: List[PrintJobRecord] = []
 
         self._failed_bg = QtGui.QColor("#3a1f1f")
+        self._alt_bg: QtGui.QBrush | None = None  # odd-row stripe, pushed by the view
 
         self._state.changed.connect(self._on_state_changed)
         self._on_state_changed()
@@ -84,9 +101,58 @@ class PrintJobsModelQt(QtCore.QAbstractTableModel):
     # -------------------------------------------------
 
     def _on_state_changed(self) -> None:
-        self.beginResetModel()
-        self._rows = list(self._state.jobs)
-        self.endResetModel()
+        jobs = list(self._state.jobs)
+        old = self._rows
+
+        # Row set changed (new job / reorder) -> full reset
+        if len(jobs) != len(old) or any(
+            a.timestamp != b.timestamp for a, b in zip(jobs, old)
+        ):
+            self.beginResetModel()
+            self._rows = jobs
+            self.endResetModel()
+            return
+
+        # Same rows -> repaint only the records that changed (failure / reprint events)
+        self._rows = jobs
+        dirty = [i for i, (a, b) in enumerate(zip(jobs, old)) if a != b]
+        self._emit_rows_changed(dirty)
+
+    def set_alternate_background(self, brush: QtGui.QBrush) -> None:
+        """Stripe odd rows via BackgroundRole instead of view-level alternating colors."""
+        if self._alt_bg is not None and self._alt_bg == brush:
+            return
+        self._alt_bg = brush
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, COLUMN_COUNT - 1),
+                [Qt.BackgroundRole],
+            )
+
+    @QtCore.Slot()
+    def on_ledger_changed(self) -> None:
+        """Ledger edits only affect the Length / Cost strip; repaint just those columns."""
+        if not self._rows:
+            return
+        self.dataChanged.emit(
+            self.index(0, COL_LENGTH),
+            self.index(len(self._rows) - 1, COL_COST),
+            [Qt.DisplayRole],
+        )
+
+    def _emit_rows_changed(self, rows: List[int]) -> None:
+        """Emit one dataChanged per contiguous run of rows."""
+        start = prev = None
+        for row in rows:
+            if prev is not None and row == prev + 1:
+                prev = row
+                continue
+            if start is not None:
+                self.dataChanged.emit(self.index(start, 0), self.index(prev, COLUMN_COUNT - 1))
+            start = prev = row
+        if start is not None:
+            self.dataChanged.emit(self.index(start, 0), self.index(prev, COLUMN_COUNT - 1))
 
     # -------------------------------------------------
     # Qt Model Interface
@@ -146,8 +212,12 @@ class PrintJobsModelQt(QtCore.QAbstractTableModel):
         # -----------------------------
         # Background
         # -----------------------------
-        if role == Qt.BackgroundRole and is_failed:
-            return self._failed_bg
+        if role == Qt.BackgroundRole:
+            if is_failed:
+                return self._failed_bg
+            if row % 2 and self._alt_bg is not None:
+                return self._alt_bg
+            return None
 
         # -----------------------------
         # Tooltips
@@ -176,20 +246,20 @@ class PrintJobsModelQt(QtCore.QAbstractTableModel):
         # -----------------------------
         if role == Qt.DisplayRole:
             if col == COL_TIME:
-                return job.timestamp.strftime("%m/%d/%Y %I:%M %p")
+                return job.display
 
             if col == COL_FILE_A:
-                return job.files[0].get("poster_id", "") if job.files else ""
+                return job.files[0].poster_id if job.files else ""
 
             if col == COL_FILE_B:
-                return job.files[1].get("poster_id", "") if len(job.files) > 1 else ""
+                return job.files[1].poster_id if len(job.files) > 1 else ""
 
             if col == COL_FORMAT:
                 mode = (job.mode or "").lower()
                 return "2-UP" if mode == "2up" else (job.size or "")
 
             if col == COL_LENGTH:
-                planned = self._planned_length_for(job)
+                planned = planned_length_for(job)
                 actual_in = getattr(job, "actual_in", None)
                 if is_failed and actual_in is not None and planned:
                     return f'{float(actual_in):.1f}" / {planned:.0f}"'
@@ -198,7 +268,7 @@ class PrintJobsModelQt(QtCore.QAbstractTableModel):
             if col == COL_COST:
                 actual_in = getattr(job, "actual_in", None)
                 if is_failed and actual_in is not None:
-                    planned = self._planned_length_for(job)
+                    planned = planned_length_for(job)
                     if planned:
                         try:
                             ratio = float(actual_in) / float(planned)
@@ -220,21 +290,3 @@ class PrintJobsModelQt(QtCore.QAbstractTableModel):
 
         return None
 
-    # -------------------------------------------------
-    # Utilities
-    # -------------------------------------------------
-
-    @staticmethod
-    def _planned_length_for(job: PrintJobRecord) -> float:
-        mode = (job.mode or "").lower()
-        size = job.size
-
-        if mode == "2up":
-            return 24.0
-        if size == "12x18":
-            return 18.0
-        if size == "18x24":
-            return 24.0
-        if size == "24x36":
-            return 36.0
-        return 0.0
@@ -7,6 +7,7 @@ from studiohub.services.core.print_log import (
     PrintLogState,
     PrintLogWriter,
     PrintJobRecord,
+    PrintJobFile,
     append_print_log,
     append_print_log_batch,
     rotate_log_if_needed,
@@ -18,6 +19,7 @@ __all__ = [
     "PrintLogState",
     "PrintLogWriter",
     "PrintJobRecord",
+    "PrintJobFile",
     "append_print_log",
     "append_print_log_batch",
     "rotate_log_if_needed",
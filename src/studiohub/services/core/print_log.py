@@ -7,6 +7,7 @@ Provides:
 - PrintLogState: Canonical, read-only state for all print jobs
 - PrintLogWriter: Atomic append operations for print logs
 - PrintJobRecord: Data class representing a print job
+- PrintJobFile: One printed file within a job
 - Batch operations and log maintenance utilities
 """
 
@@ -14,10 +15,12 @@ from __future__ import annotations
 
 import json
 import socket
+from contextlib import contextmanager
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Tuple, Iterable, TYPE_CHECKING
+from typing import List, Dict, Any, Iterator, NamedTuple, Optional, Tuple, Iterable, TYPE_CHECKING
 
 from PySide6 import QtCore
 
@@ -42,6 +45,14 @@ PRINT_LOG_EVENT_V1 = "print_log_event_v1"
 # Canonical Job Row (base job + merged event fields)
 # =====================================================
 
+class PrintJobFile(NamedTuple):
+    """One file printed as part of a job (attribute access, no per-file dict)."""
+
+    path: Optional[str]
+    source: Optional[str]
+    poster_id: str
+
+
 @dataclass(frozen=True)
 class PrintJobRecord:
     """
@@ -51,7 +62,7 @@ class PrintJobRecord:
         timestamp: When the job was printed
         mode: "single" or "2up"
         size: Paper size (e.g., "12x18", "18x24", "24x36")
-        files: List of files printed, each with path, source, poster_id
+        files: List of PrintJobFile (path, source, poster_id)
         cost_usd: Estimated cost of the print
     
     Derived fields (merged from events):
@@ -67,7 +78,7 @@ class PrintJobRecord:
     timestamp: datetime
     mode: str
     size: str
-    files: List[Dict[str, Any]]   # {path, source, poster_id}
+    files: List[PrintJobFile]
     cost_usd: float
 
     # Derived / merged (from events)
@@ -79,6 +90,17 @@ class PrintJobRecord:
     reprinted: bool = False
     reprinted_at: Optional[datetime] = None
 
+    # Formatted once per record (frozen, so the timestamp never changes)
+    @cached_property
+    def iso(self) -> str:
+        """Job id: ISO-8601 timestamp."""
+        return self.timestamp.isoformat()
+
+    @cached_property
+    def display(self) -> str:
+        """Timestamp as shown in the UI."""
+        return self.timestamp.strftime("%m/%d/%Y %I:%M %p")
+
 
 # =====================================================
 # Print Log State (Read-only, Canonical)
@@ -114,6 +136,12 @@ class PrintLogState(QtCore.QObject):
         
         # Debounce timer for cache invalidation
         self._invalidation_timer: QtCore.QTimer | None = None
+        self._pending_invalidation_reason = "print_added"
+
+        # Batch state: writes inside batch() reload + emit `changed` once on exit
+        self._batch_depth = 0
+        self._reload_pending = False
+        self._changed_pending = False
         
     def set_dashboard_service(self, dashboard_service: DashboardService) -> None:
         """
@@ -148,15 +176,55 @@ class PrintLogState(QtCore.QObject):
     def _schedule_cache_invalidation(self, reason: str) -> None:
         """Schedule cache invalidation with debouncing."""
         if not self._invalidation_timer:
-            self._invalidation_timer = QtCore.QTimer()
+            self._invalidation_timer = QtCore.QTimer(self)
             self._invalidation_timer.setSingleShot(True)
-            self._invalidation_timer.timeout.connect(
-                lambda: self._invalidate_dashboard_cache(reason)
-            )
-        
+            self._invalidation_timer.timeout.connect(self._on_invalidation_timeout)
+
+        self._pending_invalidation_reason = reason
         if not self._invalidation_timer.isActive():
             self._invalidation_timer.start(300)  # 300ms debounce
 
+    @QtCore.Slot()
+    def _on_invalidation_timeout(self) -> None:
+        self._invalidate_dashboard_cache(self._pending_invalidation_reason)
+
+    # -------------------------------------------------
+    # Batching
+    # -------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator["PrintLogState"]:
+        """
+        Group several writes/reloads into one reload and one `changed` emission.
+
+        Nested blocks are allowed; only the outermost exit flushes.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                changed = self._changed_pending
+                self._changed_pending = False
+                if self._reload_pending:
+                    self._reload_pending = False
+                    self.load()  # emits `changed` itself
+                elif changed:
+                    self.changed.emit()
+
+    def _emit_changed(self) -> None:
+        if self._batch_depth:
+            self._changed_pending = True
+            return
+        self.changed.emit()
+
+    def _reload_after_write(self) -> None:
+        if self._batch_depth:
+            self._reload_pending = True
+            return
+        self.load()
+
     # -------------------------------------------------
     # Lifecycle
     # -------------------------------------------------
@@ -167,7 +235,7 @@ class PrintLogState(QtCore.QObject):
         try:
             if not self._path.exists():
                 self._jobs = []
-                self.changed.emit()
+                self._emit_changed()
                 return
 
             base_jobs: Dict[str, PrintJobRecord] = {}
@@ -191,7 +259,7 @@ class PrintLogState(QtCore.QObject):
                     if schema == PRINT_LOG_SCHEMA_V2 and self._looks_like_base_job(record):
                         job = self._parse_base_job(record)
                         if job:
-                            base_jobs[job.timestamp.isoformat()] = job
+                            base_jobs[job.iso] = job
                         continue
 
                     # -----------------------------
@@ -235,7 +303,7 @@ class PrintLogState(QtCore.QObject):
             jobs = list(merged.values())
             jobs.sort(key=lambda j: j.timestamp, reverse=True)
             self._jobs = jobs
-            self.changed.emit()
+            self._emit_changed()
 
         except Exception as exc:
             self.error.emit(f"Print log load failed: {exc}")
@@ -281,7 +349,7 @@ class PrintLogState(QtCore.QObject):
 
         try:
             self._writer.append(record)
-            self.load()  # Reload to incorporate the new event
+            self._reload_after_write()  # Reload to incorporate the new event
             self._schedule_cache_invalidation("print_failed")
         except Exception as exc:
             self.error.emit(f"Failed to record print failure: {exc}")
@@ -311,7 +379,7 @@ class PrintLogState(QtCore.QObject):
 
         try:
             self._writer.append(record)
-            self.load()  # Reload to incorporate the new event
+            self._reload_after_write()  # Reload to incorporate the new event
             self._schedule_cache_invalidation("print_added")
         except Exception as exc:
             self.error.emit(f"Failed to record reprint event: {exc}")
@@ -347,16 +415,15 @@ class PrintLogState(QtCore.QObject):
         except Exception:
             return None
 
-        files: list[dict[str, Any]] = []
+        files: list[PrintJobFile] = []
         for f in record.get("files", []) or []:
             if not isinstance(f, dict):
                 continue
-            source = self._normalize_source(f.get("source"))
-            files.append({
-                "path": f.get("path"),
-                "source": source,
-                "poster_id": f.get("poster_id") or f.get("name") or "",
-            })
+            files.append(PrintJobFile(
+                path=f.get("path"),
+                source=self._normalize_source(f.get("source")),
+                poster_id=f.get("poster_id") or f.get("name") or "",
+            ))
 
         return PrintJobRecord(
             timestamp=ts,
@@ -24,6 +24,7 @@ from studiohub.services.dashboard.snapshot import (
 )
 
 from studiohub.constants import PRINT_SIZES
+from studiohub.services.core.print_log import PrintJobFile
 
 # ============================================================
 # Helpers
@@ -404,12 +405,16 @@ class DashboardService:
                 files = getattr(job, "files", None) or []
 
                 for f in files:
-                    if not isinstance(f, dict):
+                    if isinstance(f, PrintJobFile):
+                        raw_source, raw_path = f.source, f.path
+                    elif isinstance(f, dict):
+                        raw_source, raw_path = f.get("source"), f.get("path")
+                    else:
                         continue
 
-                    src = _normalize_source(f.get("source"))
+                    src = _normalize_source(raw_source)
                     if src not in ("archive", "studio"):
-                        src = self._infer_source_from_path(f.get("path"))
+                        src = self._infer_source_from_path(raw_path)
 
                     if src not in ("archive", "studio"):
                         continue
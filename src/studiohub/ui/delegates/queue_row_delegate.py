@@ -0,0 +1,339 @@
+# ui/delegates/queue_row_delegate.py
+from __future__ import annotations
+
+from PySide6 import QtCore, QtGui, QtWidgets
+from PySide6.QtCore import Qt
+
+from studiohub.style.typography.rules import get_manager
+
+ROLE_KIND = Qt.UserRole + 1
+
+
+class QueueRowDelegate(QtWidgets.QStyledItemDelegate):
+    """
+    Painted queue row — replaces per-row QueueRowFactory widgets.
+
+    Row kinds (ROLE_KIND):
+    - "template-header":  bold template name in the highlight color + indicator
+    - "poster-row":       poster name
+
+    Headers after the first carry a GROUP_GAP inset above them, which
+    separates template groups without extra spacer items.
+
+    Contract:
+    - DisplayRole -> row text
+    - ROLE_KIND   -> row kind
+    """
+
+    ROW_HEIGHT = 42
+    GROUP_GAP = 10
+    H_MARGIN = 10
+    V_MARGIN = 8
+    SPACING = 8
+
+    def __init__(
+        self,
+        parent: QtWidgets.QWidget | None = None,
+        *,
+        indicator_width: int = 4,
+    ) -> None:
+        super().__init__(parent)
+        self._indicator_width = int(indicator_width)
+        self._colors: dict[str, QtGui.QColor] | None = None
+
+        # Shared fonts (built once, not per painted row)
+        self._header_font = QtGui.QFont(get_manager().get_font("body"))
+        self._header_font.setBold(True)
+        self._row_font = get_manager().get_font("body-small")
+
+    # -------------------------------------------------
+    # Theme
+    # -------------------------------------------------
+
+    @staticmethod
+    def _token_color(name: str, fallback: QtGui.QColor) -> QtGui.QColor:
+        app = QtWidgets.QApplication.instance()
+        tokens = app.property("theme_tokens") if app else None
+        val = getattr(tokens, name, None) if tokens is not None else None
+        if isinstance(val, str) and val:
+            return QtGui.QColor(val)
+        return fallback
+
+    def invalidate_colors(self) -> None:
+        """Drop cached colors; they are re-resolved on the next paint."""
+        self._colors = None
+
+    def _resolve_colors(self, palette: QtGui.QPalette) -> dict[str, QtGui.QColor]:
+        if self._colors is None:
+            self._colors = {
+                "text": palette.color(QtGui.QPalette.Text),
+                "header": palette.color(QtGui.QPalette.Highlight),
+                "indicator_on": self._token_color("accent", palette.color(QtGui.QPalette.Highlight)),
+                "indicator_off": self._token_color("surface_hover", palette.color(QtGui.QPalette.Mid)),
+            }
+        return self._colors
+
+    # -------------------------------------------------
+    # Size
+    # -------------------------------------------------
+
+    def sizeHint(
+        self,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> QtCore.QSize:
+        return QtCore.QSize(0, self.ROW_HEIGHT + self._top_gap(index))
+
+    def _top_gap(self, index: QtCore.QModelIndex) -> int:
+        if index.row() > 0 and index.data(ROLE_KIND) == "template-header":
+            return self.GROUP_GAP
+        return 0
+
+    # -------------------------------------------------
+    # Paint
+    # -------------------------------------------------
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        kind = index.data(ROLE_KIND)
+
+        painter.save()
+
+        # Background / selection like Qt would (QSS-driven), below the group gap
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.rect = option.rect.adjusted(0, self._top_gap(index), 0, 0)
+        text = opt.text
+        opt.text = ""
+        opt.icon = QtGui.QIcon()
+
+        widget = opt.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, widget)
+
+        rect = opt.rect.adjusted(self.H_MARGIN, self.V_MARGIN, -self.H_MARGIN, -self.V_MARGIN)
+        colors = self._resolve_colors(option.palette)
+
+        if kind == "template-header":
+            # Indicator column (right edge), accent when selected
+            selected = bool(option.state & QtWidgets.QStyle.State_Selected)
+            ind_color = colors["indicator_on"] if selected else colors["indicator_off"]
+
+            ind_rect = QtCore.QRect(
+                rect.right() - self._indicator_width + 1,
+                rect.top(),
+                self._indicator_width,
+                rect.height(),
+            )
+            painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(ind_color)
+            painter.drawRoundedRect(ind_rect, 2, 2)
+            rect.setRight(ind_rect.left() - self.SPACING)
+
+            font = self._header_font
+            color = colors["header"]
+        else:
+            font = self._row_font
+            color = colors["text"]
+
+        fm = QtGui.QFontMetrics(font)
+        painter.setFont(font)
+        painter.setPen(color)
+        painter.drawText(
+            rect,
+            Qt.AlignVCenter | Qt.AlignLeft,
+            fm.elidedText(text, Qt.ElideRight, rect.width()),
+        )
+
+        painter.restore()
+
+
+class PrintQueueRowDelegate(QueueRowDelegate):
+    """
+    Painted Print Manager queue row — replaces per-row QueueRowFactory frames.
+
+    Each row is one print: a single job, or a 12x18 2-UP pair drawn as two
+    stacked names. Layout mirrors QueueRowFactory: name(s), badge, indicator.
+
+    Contract:
+    - UserRole -> list[dict] payload (1 or 2 items)
+    """
+
+    BADGE_RADIUS = 6
+    BADGE_V_PADDING = 2
+    PAIR_LINE_SPACING = 2
+    PAIR_BADGE_TEXT = "12×18 · 2-UP"
+
+    def __init__(
+        self,
+        parent: QtWidgets.QWidget | None = None,
+        *,
+        badge_width: int = 100,
+        indicator_width: int = 4,
+    ) -> None:
+        super().__init__(parent, indicator_width=indicator_width)
+        self._badge_width = int(badge_width)
+
+        manager = get_manager()
+        self._name_font = manager.get_font("body")
+        self._pair_font = manager.get_font("body-small")
+        self._badge_font = QtGui.QFont(manager.get_font("caption"))
+        self._badge_font.setWeight(QtGui.QFont.DemiBold)
+
+        # Row heights depend only on the fonts: compute once
+        v_pad = 2 * self.V_MARGIN
+        pair_fm = QtGui.QFontMetrics(self._pair_font)
+        self._single_height = max(
+            self.ROW_HEIGHT, QtGui.QFontMetrics(self._name_font).height() + v_pad
+        )
+        self._pair_height = max(
+            self.ROW_HEIGHT, 2 * pair_fm.height() + self.PAIR_LINE_SPACING + v_pad
+        )
+        self._badge_height = (
+            QtGui.QFontMetrics(self._badge_font).height() + 2 * self.BADGE_V_PADDING
+        )
+
+        # Badge texts are a handful of sizes + the pair label: lay each out once
+        self._badge_texts: dict[str, QtGui.QStaticText] = {}
+
+    def _resolve_colors(self, palette: QtGui.QPalette) -> dict[str, QtGui.QColor]:
+        if self._colors is None:
+            colors = super()._resolve_colors(palette)
+            colors["badge_bg"] = self._token_color(
+                "accent", palette.color(QtGui.QPalette.Highlight)
+            )
+            colors["badge_text"] = self._token_color(
+                "text_primary", palette.color(QtGui.QPalette.HighlightedText)
+            )
+        return self._colors
+
+    def _badge_static_text(self, text: str) -> QtGui.QStaticText:
+        static = self._badge_texts.get(text)
+        if static is None:
+            static = QtGui.QStaticText(text)
+            static.setTextFormat(Qt.PlainText)
+            static.prepare(QtGui.QTransform(), self._badge_font)
+            self._badge_texts[text] = static
+        return static
+
+    # -------------------------------------------------
+    # Size
+    # -------------------------------------------------
+
+    def sizeHint(
+        self,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> QtCore.QSize:
+        payload = index.data(Qt.UserRole) or []
+        height = self._pair_height if len(payload) == 2 else self._single_height
+        return QtCore.QSize(0, height)
+
+    # -------------------------------------------------
+    # Paint
+    # -------------------------------------------------
+
+    def paint(
+        self,
+        painter: QtGui.QPainter,
+        option: QtWidgets.QStyleOptionViewItem,
+        index: QtCore.QModelIndex,
+    ) -> None:
+        payload = index.data(Qt.UserRole) or []
+
+        painter.save()
+
+        # Background / selection like Qt would (QSS-driven)
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        opt.icon = QtGui.QIcon()
+
+        widget = opt.widget
+        style = widget.style() if widget is not None else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.CE_ItemViewItem, opt, painter, widget)
+
+        rect = option.rect.adjusted(self.H_MARGIN, self.V_MARGIN, -self.H_MARGIN, -self.V_MARGIN)
+        colors = self._resolve_colors(option.palette)
+        selected = bool(option.state & QtWidgets.QStyle.State_Selected)
+
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.setPen(Qt.NoPen)
+
+        # Indicator (right edge), accent when selected
+        ind_rect = QtCore.QRect(
+            rect.right() - self._indicator_width + 1,
+            rect.top(),
+            self._indicator_width,
+            rect.height(),
+        )
+        painter.setBrush(colors["indicator_on"] if selected else colors["indicator_off"])
+        painter.drawRoundedRect(ind_rect, 2, 2)
+
+        # Badge, vertically centered left of the indicator
+        is_pair = len(payload) == 2
+        if is_pair:
+            badge_text = self.PAIR_BADGE_TEXT
+        else:
+            badge_text = ((payload[0] if payload else {}).get("size") or "").replace("x", "×")
+
+        badge_rect = QtCore.QRect(
+            ind_rect.left() - self.SPACING - self._badge_width,
+            rect.center().y() - self._badge_height // 2,
+            self._badge_width,
+            self._badge_height,
+        )
+        painter.setBrush(colors["badge_bg"])
+        painter.drawRoundedRect(badge_rect, self.BADGE_RADIUS, self.BADGE_RADIUS)
+        static = self._badge_static_text(badge_text)
+        text_size = static.size()
+        painter.setFont(self._badge_font)
+        painter.setPen(colors["badge_text"])
+        painter.drawStaticText(
+            QtCore.QPointF(
+                badge_rect.x() + (badge_rect.width() - text_size.width()) / 2,
+                badge_rect.y() + (badge_rect.height() - text_size.height()) / 2,
+            ),
+            static,
+        )
+
+        # Name(s)
+        rect.setRight(badge_rect.left() - self.SPACING)
+        painter.setPen(colors["text"])
+
+        if is_pair:
+            font = self._pair_font
+            fm = QtGui.QFontMetrics(font)
+            line_h = fm.height()
+            top = rect.center().y() - (2 * line_h + self.PAIR_LINE_SPACING) // 2
+            painter.setFont(font)
+            for i, item in enumerate(payload):
+                line = QtCore.QRect(
+                    rect.left(), top + i * (line_h + self.PAIR_LINE_SPACING),
+                    rect.width(), line_h,
+                )
+                painter.drawText(
+                    line,
+                    Qt.AlignVCenter | Qt.AlignLeft,
+                    fm.elidedText((item or {}).get("name", ""), Qt.ElideRight, line.width()),
+                )
+        else:
+            font = self._name_font
+            fm = QtGui.QFontMetrics(font)
+            painter.setFont(font)
+            painter.drawText(
+                rect,
+                Qt.AlignVCenter | Qt.AlignLeft,
+                fm.elidedText(
+                    (payload[0] if payload else {}).get("name", ""),
+                    Qt.ElideRight,
+                    rect.width(),
+                ),
+            )
+
+        painter.restore()
@@ -191,15 +191,13 @@ class MemoryMonitorDialog(QDialog):
         self._refresh()
     
     def _clear_icon_cache(self):
-        """Clear the global icon cache."""
+        """Clear the global icon cache (Qt's process-wide QPixmapCache)."""
         try:
-            from studiohub.ui.views.missing_files_view_qt import _ICON_CACHE
-            size = len(_ICON_CACHE)
-            _ICON_CACHE.clear()
+            QtGui.QPixmapCache.clear()
             QtWidgets.QMessageBox.information(
                 self,
                 "Cache Cleared",
-                f"Cleared {size} icons from cache"
+                "Cleared the shared pixmap cache"
             )
         except Exception as e:
             QtWidgets.QMessageBox.warning(
@@ -264,13 +262,9 @@ class MemoryMonitorDialog(QDialog):
         
         # Icon cache
         try:
-            from studiohub.ui.views.missing_files_view_qt import _ICON_CACHE
-            lines.append(f"Icon cache: {len(_ICON_CACHE)} items")
-            
-            # Estimate size (rough)
-            if hasattr(_ICON_CACHE, '__sizeof__'):
-                size_bytes = _ICON_CACHE.__sizeof__()
-                lines.append(f"  Approx size: {size_bytes / 1024 / 1024:.1f} MB")
+            # Icons live in QPixmapCache, which exposes its limit but not a count
+            limit_kb = QtGui.QPixmapCache.cacheLimit()
+            lines.append(f"Icon cache: QPixmapCache (limit {limit_kb / 1024:.1f} MB)")
         except:
             lines.append("Icon cache: N/A")
         
@@ -26,9 +26,6 @@ class PrintFailedDialog(QtWidgets.QDialog):
     ):
         super().__init__(parent)
 
-        self.job_id = job_id
-        self.planned_in = planned_in
-
         self.setWindowTitle("Print Failed")
         self.setModal(True)
         self.setObjectName("PrintFailedDialog")
@@ -36,17 +33,20 @@ class PrintFailedDialog(QtWidgets.QDialog):
 
         self.setMinimumWidth(400)
 
-        self._build(
+        self._build()
+        self.reset(
+            job_id=job_id,
             display_time=display_time,
             file_a=file_a,
             file_b=file_b,
+            planned_in=planned_in,
         )
 
     # -------------------------------------------------
     # UI
     # -------------------------------------------------
 
-    def _build(self, *, display_time: str, file_a: str, file_b: str | None):
+    def _build(self):
         root = QtWidgets.QVBoxLayout(self)
         root.setContentsMargins(20, 20, 20, 20)
         root.setSpacing(12)
@@ -58,21 +58,21 @@ class PrintFailedDialog(QtWidgets.QDialog):
         job_row = QtWidgets.QHBoxLayout()
 
         lbl_job = QtWidgets.QLabel("Job ID (Time)")
-        val_time = QtWidgets.QLabel(display_time)
+        self.val_time = QtWidgets.QLabel()
 
         apply_typography(lbl_job, "body")
-        apply_typography(val_time, "body")
+        apply_typography(self.val_time, "body")
 
         # Bold label
         font = lbl_job.font()
         font.setWeight(QtGui.QFont.Bold)
         lbl_job.setFont(font)
 
-        val_time.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+        self.val_time.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
 
         job_row.addWidget(lbl_job)
         job_row.addStretch(1)
-        job_row.addWidget(val_time)
+        job_row.addWidget(self.val_time)
 
         root.addLayout(job_row)
 
@@ -82,10 +82,10 @@ class PrintFailedDialog(QtWidgets.QDialog):
         # File rows
         # -------------------------------------------------
 
-        def file_row(label: str, value: str):
+        def file_row(label: str):
             h = QtWidgets.QHBoxLayout()
             l = QtWidgets.QLabel(f"{label}:")
-            v = QtWidgets.QLabel(value)
+            v = QtWidgets.QLabel()
 
             apply_typography(l, "body")
             apply_typography(v, "body")
@@ -100,12 +100,17 @@ class PrintFailedDialog(QtWidgets.QDialog):
             h.addWidget(l)
             h.addStretch(1)
             h.addWidget(v)
-            return h
+            return h, l, v
 
-        root.addLayout(file_row("File A", file_a))
+        row_a, _, self.val_file_a = file_row("File A")
+        root.addLayout(row_a)
 
-        if file_b:
-            root.addLayout(file_row("File B", file_b))
+        # File B lives in its own widget so it collapses fully when hidden
+        row_b, _, self.val_file_b = file_row("File B")
+        row_b.setContentsMargins(0, 0, 0, 0)
+        self.file_b_row = QtWidgets.QWidget()
+        self.file_b_row.setLayout(row_b)
+        root.addWidget(self.file_b_row)
 
         root.addSpacing(4)
 
@@ -116,10 +121,10 @@ class PrintFailedDialog(QtWidgets.QDialog):
         planned_row = QtWidgets.QHBoxLayout()
 
         lbl_planned = QtWidgets.QLabel("Planned Length")
-        val_planned = QtWidgets.QLabel(f"{self.planned_in:.1f} in")
+        self.val_planned = QtWidgets.QLabel()
 
         apply_typography(lbl_planned, "body")
-        apply_typography(val_planned, "body")
+        apply_typography(self.val_planned, "body")
 
         # Bold label
         font = lbl_planned.font()
@@ -128,7 +133,7 @@ class PrintFailedDialog(QtWidgets.QDialog):
 
         planned_row.addWidget(lbl_planned)
         planned_row.addStretch(1)
-        planned_row.addWidget(val_planned)
+        planned_row.addWidget(self.val_planned)
 
         root.addLayout(planned_row)
 
@@ -144,7 +149,8 @@ class PrintFailedDialog(QtWidgets.QDialog):
 
 
         self.actual_edit = QtWidgets.QLineEdit()
-        self.actual_edit.setValidator(QDoubleValidator(0, self.planned_in, 1))
+        self._actual_validator = QDoubleValidator(0, 0, 1, self)
+        self.actual_edit.setValidator(self._actual_validator)
         self.actual_edit.setFixedWidth(40)
         apply_typography(self.actual_edit, "body")
 
@@ -234,12 +240,37 @@ class PrintFailedDialog(QtWidgets.QDialog):
         root.addSpacing(6)
         root.addLayout(btn_row)
 
-        QtCore.QTimer.singleShot(0, self.actual_edit.setFocus)
-
     # -------------------------------------------------
     # Public API
     # -------------------------------------------------
 
+    def reset(
+        self,
+        *,
+        job_id: str,
+        display_time: str,
+        file_a: str,
+        file_b: str | None,
+        planned_in: float,
+    ) -> None:
+        """Point the dialog at a job and clear previous input (reused across opens)."""
+        self.job_id = job_id
+        self.planned_in = planned_in
+
+        self.val_time.setText(display_time)
+        self.val_file_a.setText(file_a)
+        self.val_file_b.setText(file_b or "")
+        self.file_b_row.setVisible(bool(file_b))
+        self.val_planned.setText(f"{planned_in:.1f} in")
+        self._actual_validator.setTop(planned_in)
+
+        self.chk_failed_all.setChecked(False)
+        self.actual_edit.setDisabled(False)
+        self.actual_edit.clear()
+        self.reason_combo.setCurrentIndex(0)
+
+        QtCore.QTimer.singleShot(0, self.actual_edit.setFocus)
+
     def get_actual_in(self) -> float:
         try:
             return float(self.actual_edit.text())
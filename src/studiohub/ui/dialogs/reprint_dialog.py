@@ -53,8 +53,8 @@ class ReprintDialog(QtWidgets.QDialog):
     ) -> None:
         super().__init__(parent)
 
-        self._job = job
         self._request: ReprintRequest | None = None
+        self._file_rows: list[tuple[QtWidgets.QWidget, QtWidgets.QLabel]] = []
 
         self.setWindowTitle("Reprint Job")
         self.setModal(True)
@@ -65,6 +65,7 @@ class ReprintDialog(QtWidgets.QDialog):
         self.setMinimumWidth(460)
 
         self._build()
+        self.reset(job)
 
     # -------------------------------------------------
     # UI
@@ -79,34 +80,19 @@ class ReprintDialog(QtWidgets.QDialog):
         # Job info
         # -------------------------------------------------
 
-        def info_row(label: str, value: str):
-            row = QtWidgets.QHBoxLayout()
-            l = QtWidgets.QLabel(f"{label}:")
-            v = QtWidgets.QLabel(value)
-
-            apply_typography(l, "label")
-            apply_typography(v, "body")
-
-            v.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
-
-            row.addWidget(l)
-            row.addStretch(1)
-            row.addWidget(v)
-            return row
-
-        display_time = self._job.timestamp.strftime("%m/%d/%Y %I:%M %p")
-        root.addLayout(info_row("Job", display_time))
+        job_row, _, self.val_job = self._info_row("Job")
+        root.addLayout(job_row)
 
         root.addWidget(self._divider())
 
         # -------------------------------------------------
-        # Files
+        # Files (rows filled / grown in reset)
         # -------------------------------------------------
 
-        for idx, f in enumerate(self._job.files):
-            label = "File A" if idx == 0 else "File B"
-            poster = f.get("poster_id") or ""
-            root.addLayout(info_row(label, poster))
+        self._files_layout = QtWidgets.QVBoxLayout()
+        self._files_layout.setContentsMargins(0, 0, 0, 0)
+        self._files_layout.setSpacing(root.spacing())
+        root.addLayout(self._files_layout)
 
         # -------------------------------------------------
         # Options
@@ -145,6 +131,33 @@ class ReprintDialog(QtWidgets.QDialog):
         root.addSpacing(8)
         root.addWidget(btns)
 
+    # -------------------------------------------------
+    # Reuse
+    # -------------------------------------------------
+
+    def reset(self, job: PrintJobRecord) -> None:
+        """Point the dialog at a job and clear the previous result (reused across opens)."""
+        self._job = job
+        self._request = None
+
+        self.val_job.setText(job.display)
+
+        while len(self._file_rows) < len(job.files):
+            label = "File A" if not self._file_rows else "File B"
+            row, _, v = self._info_row(label)
+            row.setContentsMargins(0, 0, 0, 0)
+            holder = QtWidgets.QWidget()
+            holder.setLayout(row)
+            self._files_layout.addWidget(holder)
+            self._file_rows.append((holder, v))
+
+        for idx, (holder, v) in enumerate(self._file_rows):
+            visible = idx < len(job.files)
+            holder.setVisible(visible)
+            if visible:
+                v.setText(job.files[idx].poster_id or "")
+
+        self.chk_reprint.setChecked(True)
         QtCore.QTimer.singleShot(0, self.chk_reprint.setFocus)
 
     # -------------------------------------------------
@@ -153,11 +166,11 @@ class ReprintDialog(QtWidgets.QDialog):
 
     def _on_accept(self) -> None:
         self._request = ReprintRequest(
-            parent_job_id=self._job.timestamp.isoformat(),
+            parent_job_id=self._job.iso,
             timestamp=datetime.utcnow(),
             mode=self._job.mode,
             size=self._job.size,
-            files=list(self._job.files),
+            files=[f._asdict() for f in self._job.files],  # dicts for the print pipeline
             mark_as_reprint=self.chk_reprint.isChecked(),
         )
         self.accept()
@@ -175,6 +188,21 @@ class ReprintDialog(QtWidgets.QDialog):
     # Helpers
     # -------------------------------------------------
 
+    def _info_row(self, label: str, value: str = ""):
+        row = QtWidgets.QHBoxLayout()
+        l = QtWidgets.QLabel(f"{label}:")
+        v = QtWidgets.QLabel(value)
+
+        apply_typography(l, "label")
+        apply_typography(v, "body")
+
+        v.setAlignment(Qt.AlignRight | Qt.AlignVCenter)
+
+        row.addWidget(l)
+        row.addStretch(1)
+        row.addWidget(v)
+        return row, l, v
+
     @staticmethod
     def _divider() -> QtWidgets.QFrame:
         line = QtWidgets.QFrame()
@@ -113,18 +113,9 @@ class QueueRowFactory:
         lbl.setFocusPolicy(QtCore.Qt.NoFocus)
         apply_typography(lbl, "caption")
 
-        # Semantic styling hooks
+        # Semantic styling hooks (shape/spacing/type live in queue.qss)
         lbl.setProperty("role", "queue-badge")
         lbl.setProperty("variant", variant)
-
-        # Non-color polish only (shape/spacing/type)
-        lbl.setStyleSheet("""
-            QLabel {
-                padding: 2px 8px;
-                border-radius: 6px;
-                font-weight: 600;
-            }
-        """)
         return lbl
 
     def build_indicator(self) -> QtWidgets.QFrame:
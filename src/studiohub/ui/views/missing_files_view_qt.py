@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Dict, Optional
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtCore import Qt
@@ -14,32 +15,118 @@ from studiohub.ui.icons import render_svg
 from studiohub.constants import PRINT_SIZES, PRINT_SIZES_DISPLAY
 
 HEADER_HEIGHT = 45
+RENDER_INTERVAL_MS = 50
 
-# Global icon cache with size limit
-_ICON_CACHE: Dict[tuple[str, str], QtGui.QIcon] = {}
-_MAX_CACHE_SIZE = 200
+# Icon pixmaps live in Qt's process-wide QPixmapCache (LRU, bounded by
+# the limit set at app startup) rather than a Python-side dict.
+_ICON_CACHE_PREFIX = "missing"
 
 
 def _get_cached_icon(icon_name: str, color: QtGui.QColor) -> QtGui.QIcon:
-    """Get cached icon with size limit."""
-    key = (icon_name, color.name(QtGui.QColor.HexArgb))
-    
-    # Check cache
-    if key in _ICON_CACHE:
-        return _ICON_CACHE[key]
-    
-    # Enforce cache size limit
-    if len(_ICON_CACHE) > _MAX_CACHE_SIZE:
-        # Remove oldest 20% of entries
-        items = list(_ICON_CACHE.items())
-        for old_key, _ in items[:len(items) // 5]:
-            del _ICON_CACHE[old_key]
-    
-    # Create new icon
-    pm = render_svg(icon_name, size=16, color=color)
-    icon = QtGui.QIcon(pm)
-    _ICON_CACHE[key] = icon
-    return icon
+    """Get icon from the shared pixmap cache, rendering on miss."""
+    key = f"{_ICON_CACHE_PREFIX}:{icon_name}:{color.name(QtGui.QColor.HexArgb)}"
+
+    pm = QtGui.QPixmapCache.find(key)
+    if pm is None or pm.isNull():
+        pm = render_svg(icon_name, size=16, color=color)
+        QtGui.QPixmapCache.insert(key, pm)
+
+    return QtGui.QIcon(pm)
+
+
+def _index_stamp(index: Dict[str, Any]) -> Optional[tuple]:
+    """Cheap change signal for a poster index: write stamp plus per-source counts."""
+    generated_at = index.get("generated_at")
+    if not generated_at:
+        return None  # Fallback/empty index: no stamp, always treated as changed
+    posters = index.get("posters") or {}
+    return (generated_at, tuple(
+        (source, len(entries)) for source, entries in posters.items()
+        if isinstance(entries, dict)
+    ))
+
+
+# =====================================================
+# Status computation (pure, no Qt)
+# =====================================================
+
+@dataclass(frozen=True)
+class FolderVM:
+    """Precomputed display state for one poster row."""
+    display_name: str
+    parent_ok: tuple[bool, ...]
+    children: tuple[tuple[str, tuple[bool, ...]], ...]
+
+
+def _compute_states(
+    posters: Dict[str, Any],
+    missing_data: Dict[str, Any],
+    source: str,
+    folders: list[str],
+) -> list[FolderVM]:
+    """
+    Compute ok/missing flags for every poster row.
+
+    parent_ok covers the Master, Web and size columns; each child is a
+    (background_label, size_ok) pair (archive only).
+    """
+    rows: list[FolderVM] = []
+    is_archive = source == "archive"
+
+    for folder in folders:
+        meta = posters.get(folder)
+        if not isinstance(meta, dict):
+            continue
+
+        # Missing data for this poster (empty dict if none)
+        missing = missing_data.get(folder, {}).get("missing", {})
+        exists = meta.get("exists", {})
+        sizes_meta = meta.get("sizes", {})
+        missing_sizes = set(missing.get("sizes") or [])
+
+        flags = [
+            bool(exists.get("master", False)) and not missing.get("master", False),
+            bool(exists.get("web", False)) and not missing.get("web", False),
+        ]
+
+        for size in PRINT_SIZES:
+            size_meta = sizes_meta.get(size, {})
+            if is_archive:
+                # Archive: size must exist and have at least one background
+                has_any_bg = any(
+                    isinstance(bg_rec, dict) and bg_rec.get("exists") is True
+                    for bg_rec in size_meta.get("backgrounds", {}).values()
+                )
+                ok = bool(size_meta.get("exists", False)) and has_any_bg
+            else:
+                # Studio: size must have files
+                files = size_meta.get("files", [])
+                ok = isinstance(files, list) and len(files) > 0
+            flags.append(ok and size not in missing_sizes)
+
+        children: list[tuple[str, tuple[bool, ...]]] = []
+        if is_archive:
+            missing_bgs = missing.get("backgrounds", {})
+
+            # Collect all backgrounds from all sizes
+            all_bgs: Dict[str, str] = {}
+            for size in PRINT_SIZES:
+                for bg_key, bg_rec in sizes_meta.get(size, {}).get("backgrounds", {}).items():
+                    if bg_key not in all_bgs:
+                        all_bgs[bg_key] = bg_rec.get("label", bg_key)
+
+            for bg_key, bg_label in sorted(all_bgs.items(), key=lambda x: x[1].lower()):
+                missing_bg_sizes = set(missing_bgs.get(bg_key, {}).get("sizes", []))
+                child_flags = []
+                for size in PRINT_SIZES:
+                    bgs = sizes_meta.get(size, {}).get("backgrounds", {})
+                    bg_exists = bg_key in bgs and bool(bgs[bg_key].get("exists", False))
+                    child_flags.append(bg_exists and size not in missing_bg_sizes)
+                children.append((bg_label, tuple(child_flags)))
+
+        rows.append(FolderVM(meta.get("display_name", folder), tuple(flags), tuple(children)))
+
+    return rows
 
 
 class CenteredIconDelegate(QtWidgets.QStyledItemDelegate):
@@ -109,6 +196,10 @@ class MissingFilesViewQt(QtWidgets.QFrame):
             "studio": {}
         }  # Store data for both sources
         self._index: Dict[str, Any] = {}
+        self._index_stamp: Optional[tuple] = None
+        self._data_revision: Dict[str, int] = {}
+        self._sorted_folders_by_source: Dict[str, list[str]] = {}
+        self._view_model: Dict[str, list[FolderVM]] = {}
         self._has_been_activated = False
         self._pending_refresh = False
         self._is_rendering = False
@@ -119,6 +210,12 @@ class MissingFilesViewQt(QtWidgets.QFrame):
         self._update_timer.timeout.connect(self._delayed_refresh)
         self._pending_update = False
 
+        # Coalescing render timer — bursts of set_data/set_index collapse
+        # into a single render (at most one every RENDER_INTERVAL_MS)
+        self._render_timer = QtCore.QTimer(self)
+        self._render_timer.setSingleShot(True)
+        self._render_timer.timeout.connect(self._do_render)
+
         # =================================================
         # WIDGETS (NO LAYOUT)
         # =================================================
@@ -224,8 +321,8 @@ class MissingFilesViewQt(QtWidgets.QFrame):
         # WIRING
         # =================================================
 
-        self.btn_archive.clicked.connect(lambda: self.set_source("archive"))
-        self.btn_studio.clicked.connect(lambda: self.set_source("studio"))
+        self.btn_archive.clicked.connect(self._on_archive_clicked)
+        self.btn_studio.clicked.connect(self._on_studio_clicked)
 
         # Keep group alive
         self._source_group = QtWidgets.QButtonGroup(self)
@@ -349,8 +446,7 @@ class MissingFilesViewQt(QtWidgets.QFrame):
 
         # Check if we have data for the current source
         if self._data.get(self._source):
-            QtCore.QTimer.singleShot(0, self._render)
-            QtCore.QTimer.singleShot(0, self._apply_column_widths)
+            self._schedule_render()
         else:
             self.refresh_requested.emit(self._source)
             # Show empty state while loading
@@ -370,8 +466,7 @@ class MissingFilesViewQt(QtWidgets.QFrame):
         
         # Show appropriate view
         if self._data.get(source):
-            QtCore.QTimer.singleShot(0, self._render)
-            QtCore.QTimer.singleShot(0, self._apply_column_widths)
+            self._schedule_render()
             self.lbl_empty.setVisible(False)
             self.tree.setVisible(True)
         else:
@@ -379,6 +474,14 @@ class MissingFilesViewQt(QtWidgets.QFrame):
         
         self.refresh_requested.emit(source)
 
+    @QtCore.Slot()
+    def _on_archive_clicked(self) -> None:
+        self.set_source("archive")
+
+    @QtCore.Slot()
+    def _on_studio_clicked(self) -> None:
+        self.set_source("studio")
+
     def set_loading(self, source: str, text: str) -> None:
         if source != self._source:
             return
@@ -395,9 +498,23 @@ class MissingFilesViewQt(QtWidgets.QFrame):
         self.lbl_empty.setVisible(False)
         self.tree.setVisible(False)
 
-    def set_data(self, source: str, data: Dict[str, Any]) -> None:
-        """Set missing data and trigger render."""
-        self._data[source] = data or {}
+    def set_data(self, source: str, data: Dict[str, Any], revision: Optional[int] = None) -> None:
+        """Set missing data and trigger render.
+
+        ``revision`` is the model's per-source counter; an unchanged revision
+        means the payload is the one already rendered.
+        """
+        data = data or {}
+        unchanged = (
+            revision is not None
+            and source in self._view_model
+            and self._data_revision.get(source) == revision
+        )
+        self._data[source] = data
+        if revision is not None:
+            self._data_revision[source] = revision
+        if not unchanged:
+            self._rebuild_view_model(source)
         
         # Only update UI if this is the current source
         if source == self._source:
@@ -406,21 +523,59 @@ class MissingFilesViewQt(QtWidgets.QFrame):
             if data:
                 self.lbl_empty.setVisible(False)
                 self.tree.setVisible(True)
+                # Re-broadcast of what the tree already shows: nothing to do
+                if unchanged and self.tree.topLevelItemCount():
+                    return
                 # Defer render to avoid blocking
-                if not self._is_rendering:
-                    QtCore.QTimer.singleShot(0, self._render)
-                    QtCore.QTimer.singleShot(0, self._apply_column_widths)
+                self._schedule_render()
             else:
                 self._show_empty_state()
 
     def set_index(self, index: Dict[str, Any]) -> None:
         """Set poster index data."""
-        self._index = index or {}
-        if self._data.get(self._source) and not self._is_rendering:
-            QtCore.QTimer.singleShot(0, self._render)
+        index = index or {}
+        stamp = _index_stamp(index)
+        if stamp is not None and stamp == self._index_stamp and self.tree.topLevelItemCount():
+            return
+        self._index = index
+        self._index_stamp = stamp
+
+        # Folder keys only change with the index, so sort once here
+        # instead of on every render.
+        self._sorted_folders_by_source = {
+            source: sorted(posters.keys(), key=str.lower)
+            for source, posters in (self._index.get("posters") or {}).items()
+            if isinstance(posters, dict)
+        }
+        for source in self._data:
+            self._rebuild_view_model(source)
+
+        if self._data.get(self._source):
+            self._schedule_render()
+
+    def _rebuild_view_model(self, source: str) -> None:
+        """Recompute per-folder flags for a source from index + missing data."""
+        posters = self._index.get("posters", {}).get(source, {})
+        self._view_model[source] = _compute_states(
+            posters,
+            self._data.get(source) or {},
+            source,
+            self._sorted_folders_by_source.get(source, []),
+        )
+
+    def _schedule_render(self) -> None:
+        """Queue a render; repeated calls within the interval coalesce."""
+        if not self._render_timer.isActive():
+            self._render_timer.start(RENDER_INTERVAL_MS)
+
+    def _do_render(self) -> None:
+        """Timer slot — perform the coalesced render."""
+        self._render()
+        self._apply_column_widths()
 
     def _show_empty_state(self) -> None:
         """Show empty state message."""
+        self._render_timer.stop()
         self.tree.clear()
         self.tree.setVisible(False)
         self.lbl_status.setVisible(False)
@@ -443,8 +598,7 @@ class MissingFilesViewQt(QtWidgets.QFrame):
         """Actually perform the refresh after debouncing."""
         self._pending_update = False
         if self._index and self._data.get(self._source):
-            self._render()
-            self._apply_column_widths()
+            self._schedule_render()
 
     # =================================================
     # Rendering (optimized)
@@ -548,12 +702,6 @@ class MissingFilesViewQt(QtWidgets.QFrame):
             self._pending_refresh = True
             return
 
-        # Get data for current source
-        current_data = self._data.get(self._source, {})
-        
-        # Even if current_data is empty, we still want to render all posters
-        # with checkmarks (meaning nothing is missing)
-
         self._is_rendering = True
         self._pending_refresh = False
 
@@ -589,105 +737,31 @@ class MissingFilesViewQt(QtWidgets.QFrame):
                 ok_icon = _get_cached_icon("status_ok", ok_color)
                 missing_icon = _get_cached_icon("status_missing", missing_color)
 
-                # Sort folders once
-                sorted_folders = sorted(posters.keys(), key=str.lower)
-                
-                items_added = False
-
-                for folder in sorted_folders:
-                    meta = posters[folder]
-                    if not isinstance(meta, dict):
-                        continue
-                    
-                    items_added = True
+                # Flags are precomputed in set_data/set_index; an empty
+                # missing payload still renders every poster as OK.
+                is_archive = self._source == "archive"
 
-                    display_name = meta.get("display_name", folder)
+                for vm in self._view_model.get(self._source, []):
                     parent = QtWidgets.QTreeWidgetItem(self.tree)
-                    parent.setText(0, display_name)
-
-                    # Get missing data for this poster (empty dict if none)
-                    missing = current_data.get(folder, {}).get("missing", {})
-                    
-                    # Master status
-                    exists = meta.get("exists", {})
-                    has_master = bool(exists.get("master", False))
-                    master_ok = has_master and not missing.get("master", False)
-                    parent.setIcon(1, ok_icon if master_ok else missing_icon)
-                    parent.setText(1, "")
-                    parent.setTextAlignment(1, Qt.AlignCenter)
-
-                    # Web status
-                    has_web = bool(exists.get("web", False))
-                    web_ok = has_web and not missing.get("web", False)
-                    parent.setIcon(2, ok_icon if web_ok else missing_icon)
-                    parent.setText(2, "")
-                    parent.setTextAlignment(2, Qt.AlignCenter)
-
-                    # Size statuses
-                    sizes_meta = meta.get("sizes", {})
-                    missing_sizes = set(missing.get("sizes") or [])
-
-                    for idx, size in enumerate(PRINT_SIZES, start=3):
-                        size_meta = sizes_meta.get(size, {})
-                        
-                        if self._source == "archive":
-                            # Archive: check if size exists and has backgrounds
-                            size_exists = size_meta.get("exists", False)
-                            size_missing = size in missing_sizes
-                            
-                            # Also check backgrounds
-                            bgs = size_meta.get("backgrounds", {})
-                            has_any_bg = any(
-                                isinstance(bg_rec, dict) and bg_rec.get("exists") is True
-                                for bg_rec in bgs.values()
-                            )
-                            
-                            ok = size_exists and has_any_bg and not size_missing
-                        else:
-                            # Studio: check if size has files
-                            files = size_meta.get("files", [])
-                            has_files = isinstance(files, list) and len(files) > 0
-                            size_missing = size in missing_sizes
-                            ok = has_files and not size_missing
-
-                        parent.setIcon(idx, ok_icon if ok else missing_icon)
-                        parent.setText(idx, "")
-                        parent.setTextAlignment(idx, Qt.AlignCenter)
+                    parent.setText(0, vm.display_name)
+
+                    for col, ok in enumerate(vm.parent_ok, start=1):
+                        parent.setIcon(col, ok_icon if ok else missing_icon)
+                        parent.setText(col, "")
+                        parent.setTextAlignment(col, Qt.AlignCenter)
 
                     # Add children for archive source (backgrounds)
-                    if self._source == "archive":
+                    if is_archive:
                         parent.setChildIndicatorPolicy(QtWidgets.QTreeWidgetItem.ShowIndicator)
 
-                        # Get missing backgrounds for this poster
-                        missing_bgs = missing.get("backgrounds", {})
-                        
-                        # Collect all backgrounds from all sizes
-                        all_bgs = {}
-                        for size in PRINT_SIZES:
-                            size_meta = sizes_meta.get(size, {})
-                            bgs = size_meta.get("backgrounds", {})
-                            for bg_key, bg_rec in bgs.items():
-                                if bg_key not in all_bgs:
-                                    all_bgs[bg_key] = bg_rec.get("label", bg_key)
-
-                        # Sort backgrounds
-                        for bg_key, bg_label in sorted(all_bgs.items(), key=lambda x: x[1].lower()):
+                        for bg_label, child_ok in vm.children:
                             child = QtWidgets.QTreeWidgetItem(parent)
                             child.setText(0, bg_label)
 
-                            # Check which sizes this background exists in
-                            missing_bg_sizes = set(missing_bgs.get(bg_key, {}).get("sizes", []))
-
-                            for idx, size in enumerate(PRINT_SIZES, start=3):
-                                size_meta = sizes_meta.get(size, {})
-                                bgs = size_meta.get("backgrounds", {})
-                                bg_exists = bg_key in bgs and bgs[bg_key].get("exists", False)
-                                
-                                ok = bg_exists and size not in missing_bg_sizes
-                                
-                                child.setIcon(idx, ok_icon if ok else missing_icon)
-                                child.setText(idx, "")
-                                child.setTextAlignment(idx, Qt.AlignCenter)
+                            for col, ok in enumerate(child_ok, start=3):
+                                child.setIcon(col, ok_icon if ok else missing_icon)
+                                child.setText(col, "")
+                                child.setTextAlignment(col, Qt.AlignCenter)
 
                         parent.setExpanded(False)
 
@@ -709,7 +783,7 @@ class MissingFilesViewQt(QtWidgets.QFrame):
 
         # Handle any pending refreshes
         if self._pending_refresh:
-            QtCore.QTimer.singleShot(0, self._render)
+            self._schedule_render()
 
     # =================================================
     # Helpers
@@ -729,9 +803,9 @@ class MissingFilesViewQt(QtWidgets.QFrame):
 
     def on_theme_changed(self):
         """Clear caches on theme change."""
-        global _ICON_CACHE
-        _ICON_CACHE.clear()
+        # Icon pixmaps are keyed by color, so stale theme entries simply
+        # age out of QPixmapCache.
         if hasattr(self, '_bg_cache'):
             self._bg_cache.clear()
         if self._data.get(self._source):
-            QtCore.QTimer.singleShot(0, self._render)
\ No newline at end of file
+            self._schedule_render()
\ No newline at end of file
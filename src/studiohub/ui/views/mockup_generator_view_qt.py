@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
 from typing import Optional, List, Dict
 
 from PySide6 import QtCore, QtGui, QtWidgets
@@ -8,7 +10,7 @@ from PySide6.QtCore import Qt
 
 from studiohub.style.utils.repolish import repolish
 from studiohub.ui.layout.row_layout import configure_view, RowProfile
-from studiohub.ui.layout.queue import QueueRowFactory
+from studiohub.ui.delegates.queue_row_delegate import QueueRowDelegate
 from studiohub.style.typography.rules import apply_view_typography, apply_typography
 from PySide6.QtGui import QFont
 
@@ -41,6 +43,52 @@ class QueueItemDTO:
     label: str
 
 
+# =====================================================
+# Posters Model
+# =====================================================
+
+class PosterListModel(QtCore.QAbstractListModel):
+    """
+    Flat poster list backing the posters view.
+
+    Wraps the hub's poster dicts directly (no per-row item objects).
+
+    Contract:
+    - DisplayRole -> poster name
+    - UserRole    -> poster dict
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._items: List[dict] = []
+
+    def set_items(self, items: List[dict]) -> None:
+        self.beginResetModel()
+        self._items = list(items or [])
+        self.endResetModel()
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._items)
+
+    def data(self, index: QtCore.QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        it = self._items[index.row()]
+        if role == Qt.DisplayRole:
+            return it.get("name", "")
+        if role == Qt.UserRole:
+            return it
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> Qt.ItemFlags:
+        if not index.isValid():
+            return Qt.NoItemFlags
+        return Qt.ItemIsEnabled | Qt.ItemIsSelectable | Qt.ItemIsDragEnabled
+
+
 # =====================================================
 # Queue Widget (Drag + Drop aware)
 # =====================================================
@@ -89,6 +137,7 @@ class QueueList(QtWidgets.QListWidget):
 
         super().mousePressEvent(event)
 
+    @QtCore.Slot()
     def _on_delete(self):
         selected = self.selectedItems()
         if not selected:
@@ -98,10 +147,10 @@ class QueueList(QtWidgets.QListWidget):
     def dropEvent(self, event: QtGui.QDropEvent):
         source = event.source()
 
-        if isinstance(source, QtWidgets.QTreeWidget):
+        if isinstance(source, QtWidgets.QTreeView):
             items = []
-            for it in source.selectedItems():
-                data = it.data(0, QtCore.Qt.UserRole)
+            for idx in source.selectionModel().selectedRows():
+                data = idx.data(QtCore.Qt.UserRole)
                 if data:
                     items.append(data)
 
@@ -179,12 +228,15 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         # STATE
         # =================================================
         self._drawer_open = False
-        self._drawer_anim: Optional[QtCore.QPropertyAnimation] = None
         self.drawer_target_width = 280
 
         self._current_source = "archive"
         self._posters_cache: Dict[str, Optional[dict]] = {"archive": None, "studio": None}
         self._selected_template: Optional[dict] = None
+        self._queue_by_template: Dict[str, List[dict]] = {}
+        self._queue_row_kinds: list[str] = []
+        self._last_queue_fingerprint: Optional[tuple] = None
+        self._rendered_posters_fp: Optional[tuple[str, int]] = None
 
         # =================================================
         # SOURCE TOGGLES (ACTIVE STATE)
@@ -233,7 +285,9 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         # =================================================
         # POSTERS TREE
         # =================================================
-        self.poster_list = QtWidgets.QTreeWidget()
+        self._posters_model = PosterListModel(self)
+        self.poster_list = QtWidgets.QTreeView()
+        self.poster_list.setModel(self._posters_model)
         self.poster_list.setHeaderHidden(True)
         self.poster_list.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
         self.poster_list.setEditTriggers(QtWidgets.QAbstractItemView.NoEditTriggers)
@@ -243,6 +297,8 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         self.poster_list.setExpandsOnDoubleClick(True)
         self.poster_list.setAnimated(False)
 
+        # Set uniform row heights for better performance
+        self.poster_list.setUniformRowHeights(True)
 
         configure_view(
             self.poster_list,
@@ -251,7 +307,7 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
             alternating=True,
         )
 
-        self.poster_list.itemDoubleClicked.connect(self._emit_add_selected)
+        self.poster_list.doubleClicked.connect(self._emit_add_selected)
         apply_view_typography(self.poster_list, "tree")
         
         # =================================================
@@ -266,6 +322,12 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         self.drawer.setProperty("square", True)
         self.drawer.setFixedWidth(0)
 
+        # One reusable slide animation; retargeted from the current width per toggle
+        self._drawer_anim = QtCore.QPropertyAnimation(self.drawer, b"maximumWidth", self)
+        self._drawer_anim.setDuration(160)
+        self._drawer_anim.setEasingCurve(QtCore.QEasingCurve.InOutQuad)
+        self._drawer_anim.finished.connect(self._on_drawer_anim_finished)
+
         self.template_list = QtWidgets.QTreeWidget()
         self.template_list.setHeaderHidden(True)
         self.template_list.setAlternatingRowColors(False)
@@ -278,21 +340,11 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         self.template_list.setItemsExpandable(False)
         self.template_list.setExpandsOnDoubleClick(False)
         self.template_list.setAnimated(False)
+        self.template_list.setUniformRowHeights(True)
 
         configure_view(self.template_list, profile=RowProfile.STANDARD, role="plain-tree")
         self.template_list.itemSelectionChanged.connect(self._on_template_selection_changed)
 
-        # NOTE: configure_view() historically assumed QTreeView/QTableView APIs.
-        # Keep the call pattern consistent, but fail soft for QListWidget.
-        try:
-            configure_view(
-                self.template_list,
-                profile=RowProfile.STANDARD,
-                role="plain-tree",
-            )
-        except Exception:
-            pass
-
         dlay = QtWidgets.QVBoxLayout(self.drawer)
         dlay.setContentsMargins(12, 12, 12, 12)
         dlay.setSpacing(10)
@@ -304,16 +356,16 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         self.queue_list = QueueList()
         self.queue_list.setAlternatingRowColors(False)  # ✅ REQUIRED
 
-        # Shared, canonical queue row widgets (single source of truth)
-        self._queue_rows = QueueRowFactory(
-            badge_width=100,
-            indicator_width=4,
+        # Rows are painted by a delegate (no per-row widgets)
+        self._queue_delegate = QueueRowDelegate(
+            self.queue_list,
+            indicator_width=self.INDICATOR_WIDTH,
         )
+        self.queue_list.setItemDelegate(self._queue_delegate)
 
         apply_view_typography(self.queue_list, "body")
         self.queue_list.items_dropped.connect(self._on_queue_items_dropped)
         self.queue_list.remove_requested.connect(self._on_queue_remove_requested)
-        self.queue_list.itemSelectionChanged.connect(self._sync_queue_row_selection_props)
 
         # NOTE: configure_view() historically assumed QTreeView/QTableView APIs.
         # Keep the call pattern consistent, but fail soft for QListWidget.
@@ -437,91 +489,25 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         return tree
 
 
-    # =================================================
-    # Queue row widgets (shared canonical implementation)
-    # =================================================
-
-    def _base_row_frame(self, *, variant: str) -> QtWidgets.QFrame:
-        return self._queue_rows.base_row_frame(variant=variant)
-
-
-    def _build_queue_poster_row_widget(self, payload: dict) -> QtWidgets.QFrame:
-        # Ensure expected keys exist
-        it = dict(payload or {})
-        it.setdefault("name", "")
-        it.setdefault("size", "")
-
-        frame = self._queue_rows.build_single_frame(
-            it,
-            show_badge=False,
-            show_indicator=False,
-        )
-
-        lbls = frame.findChildren(QtWidgets.QLabel)
-        if lbls:
-            lbl = lbls[0]
-
-            # Typography: smaller than template header
-            apply_typography(lbl, "body-small")
-
-            # Color: text_primary via palette
-            pal = lbl.palette()
-            pal.setColor(
-                QtGui.QPalette.WindowText,
-                self.queue_list.palette().color(QtGui.QPalette.Text)
-            )
-            lbl.setPalette(pal)
-
-        return frame
-
-
-    def _build_queue_template_header_widget(self, template_name: str) -> QtWidgets.QFrame:
-        # Header row uses the same base frame + spacing as Print Manager rows.
-        frame = self._queue_rows.base_row_frame(variant="header")
-        layout = frame.layout()
-
-        lbl = QtWidgets.QLabel(template_name or "-- No Template --")
-        lbl.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
-        lbl.setFocusPolicy(QtCore.Qt.NoFocus)
-
-        apply_typography(lbl, "body")
-
-        f = lbl.font()
-        f.setBold(True)
-        lbl.setFont(f)
-
-        pal = lbl.palette()
-        pal.setColor(
-            QtGui.QPalette.WindowText,
-            self.queue_list.palette().color(QtGui.QPalette.Highlight)
-        )
-        
-        lbl.setPalette(pal)
-
-        layout.addWidget(lbl, 1)
-
-        # Keep right-edge alignment consistent (indicator column)
-        ind = self._queue_rows.build_indicator()
-        ind.setAttribute(QtCore.Qt.WA_TransparentForMouseEvents, True)
-        layout.addWidget(ind)
-
-        return frame
-
     def toggle_drawer(self):
         self._drawer_open = not self._drawer_open
         self.drawer_handle.setChecked(self._drawer_open)
 
-        start = self.drawer.width()
         end = self.drawer_target_width if self._drawer_open else 0
 
-        anim = QtCore.QPropertyAnimation(self.drawer, b"maximumWidth", self)
-        anim.setDuration(160)
-        anim.setStartValue(start)
+        anim = self._drawer_anim
+        if anim.state() == QtCore.QAbstractAnimation.Running:
+            anim.stop()
+        anim.setStartValue(self.drawer.width())
         anim.setEndValue(end)
-        anim.setEasingCurve(QtCore.QEasingCurve.InOutQuad)
+
+        # Only the final frame of the drawer needs painting
+        self.drawer.setUpdatesEnabled(False)
         anim.start()
 
-        self._drawer_anim = anim
+    @QtCore.Slot()
+    def _on_drawer_anim_finished(self):
+        self.drawer.setUpdatesEnabled(True)
 
     # =================================================
     # Template selection
@@ -604,14 +590,21 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
             if queue is not None:
                 self.set_queue(queue)
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() in (QtCore.QEvent.StyleChange, QtCore.QEvent.PaletteChange):
+            # Theme switch: drop cached queue colors so the next paint re-resolves them
+            self._queue_delegate.invalidate_colors()
+            self.queue_list.viewport().update()
+
     # =================================================
     # Queue input (double click / drag-drop)
     # =================================================
 
     def _emit_add_selected(self):
         posters = []
-        for it in self.poster_list.selectedItems():
-            data = it.data(0, QtCore.Qt.UserRole)
+        for idx in self.poster_list.selectionModel().selectedRows():
+            data = idx.data(QtCore.Qt.UserRole)
             if data:
                 posters.append(data)
 
@@ -648,39 +641,52 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
     # =================================================
 
     def _render_posters(self, data: dict):
-        self.poster_list.setUpdatesEnabled(False)
-        self.poster_list.clear()
-
         # Mockups use ONLY 12x18
         items = (data or {}).get("12x18") or []
 
-        for it in items:
-            display_name = it.get("name", "")
-
-            row = QtWidgets.QTreeWidgetItem([display_name])
-            row.setData(0, QtCore.Qt.UserRole, it)
-            row.setFlags(
-                QtCore.Qt.ItemIsEnabled
-                | QtCore.Qt.ItemIsSelectable
-                | QtCore.Qt.ItemIsDragEnabled
-            )
-
-            self.poster_list.addTopLevelItem(row)
+        # poster_list is shared by both sources, so the fingerprint covers
+        # what the tree currently shows rather than each source separately
+        fp = (
+            self._current_source,
+            hash(tuple((it.get("path", ""), it.get("name", "")) for it in items)),
+        )
+        if fp == self._rendered_posters_fp and self._posters_model.rowCount():
+            return
+        self._rendered_posters_fp = fp
 
-        self.poster_list.setUpdatesEnabled(True)
+        self._posters_model.set_items(items)
 
     def _render_templates(self, items: list):
-        self.template_list.setUpdatesEnabled(False)
-        self.template_list.clear()
-
+        rows = []
         for it in items or []:
             name = (it or {}).get("name", "")
             row = QtWidgets.QTreeWidgetItem([name])
             row.setData(0, QtCore.Qt.UserRole, it)
             row.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            self.template_list.addTopLevelItem(row)
-
-        self.template_list.setUpdatesEnabled(True)
+            rows.append(row)
+
+        self._replace_tree_rows(self.template_list, rows)
+
+        # Selection signals were blocked during the swap; resync the template
+        self._on_template_selection_changed()
+
+    @staticmethod
+    def _replace_tree_rows(
+        tree: QtWidgets.QTreeWidget,
+        rows: list[QtWidgets.QTreeWidgetItem],
+    ) -> None:
+        """Swap all top-level rows in one bulk insert."""
+        sorting = tree.isSortingEnabled()
+        tree.setUpdatesEnabled(False)
+        tree.setSortingEnabled(False)
+        tree.blockSignals(True)
+        try:
+            tree.clear()
+            tree.addTopLevelItems(rows)
+        finally:
+            tree.blockSignals(False)
+            tree.setSortingEnabled(sorting)
+            tree.setUpdatesEnabled(True)
 
     # =================================================
     # Queue rendering
@@ -693,53 +699,73 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
             Poster
             Poster
         """
-        self.queue_list.setUpdatesEnabled(False)
-        self.queue_list.clear()
+        # Re-resolve palette/token colors once per push, not per painted row;
+        # done before the fingerprint check so an unchanged queue still picks them up
+        self._queue_delegate.invalidate_colors()
 
-        grouped: Dict[str, List[dict]] = {}
-        for it in items or []:
-            tpl = it.get("template") or "-- No Template --"
-            grouped.setdefault(tpl, []).append(it)
-
-        first_group = True
-
-        for tpl in sorted(grouped.keys(), key=lambda s: (s or "").lower()):
-            posters = grouped[tpl]
-            posters.sort(key=lambda p: (p.get("name") or "").lower())
+        fingerprint = tuple(
+            (it.get("path"), it.get("template"), it.get("name")) for it in items or []
+        )
+        if fingerprint == self._last_queue_fingerprint:
+            self.queue_list.viewport().update()
+            return
 
-            # ---- spacing between template groups ----
-            if not first_group:
-                spacer = QtWidgets.QListWidgetItem("")
-                spacer.setFlags(QtCore.Qt.NoItemFlags)
-                spacer.setData(QtCore.Qt.UserRole, None)
-                spacer.setSizeHint(QtCore.QSize(0, 10))
-                self.queue_list.addItem(spacer)
+        self.queue_list.setUpdatesEnabled(False)
 
-            first_group = False
+        # One sort over (template, name), keys built once per item; the raw
+        # template breaks case-only ties so each template stays contiguous.
+        decorated = []
+        for i, it in enumerate(items or []):
+            tpl = it.get("template") or "-- No Template --"
+            decorated.append((tpl.lower(), tpl, (it.get("name") or "").lower(), i, it))
+        decorated.sort(key=lambda d: d[:4])
+
+        # Flatten into (kind, template, payload) row specs; header deletes look
+        # up their posters in _queue_by_template instead of rescanning the list
+        rows: list[tuple[str, str, Optional[dict]]] = []
+        by_template: Dict[str, List[dict]] = {}
+        for tpl, group in groupby(decorated, key=itemgetter(1)):
+            posters = [d[4] for d in group]
+            by_template[tpl] = posters
+
+            rows.append(("template-header", tpl, None))
+            rows.extend(("poster-row", tpl, p) for p in posters)
+
+        self._queue_by_template = by_template
+
+        # Reused rows get new payloads, so remember the selection by key and
+        # restore it afterwards instead of leaving it on the old row numbers
+        selected_keys = {
+            self._queue_item_key(li) for li in self.queue_list.selectedItems()
+        }
 
-            # ---- template header (widget row; print manager style) ----
-            header_item = QtWidgets.QListWidgetItem()
-            header_item.setData(QtCore.Qt.UserRole, None)  # critical for delete semantics
-            header_item.setData(QtCore.Qt.UserRole + 1, "template-header")
+        # Keep existing rows while the row kind matches; only the divergent
+        # tail is dropped and rebuilt.
+        reuse = 0
+        for (kind, _, _), old_kind in zip(rows, self._queue_row_kinds):
+            if kind != old_kind:
+                break
+            reuse += 1
 
-            header_frame = self._build_queue_template_header_widget(tpl)
-            header_item.setSizeHint(header_frame.sizeHint())
+        for i in range(self.queue_list.count() - 1, reuse - 1, -1):
+            self.queue_list.takeItem(i)
 
-            header_item.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
-            self.queue_list.addItem(header_item)
-            self.queue_list.setItemWidget(header_item, header_frame)
+        for i in range(reuse):
+            kind, tpl, p = rows[i]
+            self._refresh_queue_row(i, kind, tpl, p)
 
-            # ---- posters under template (widget rows; print manager style) ----
-            for p in posters:
-                li = QtWidgets.QListWidgetItem()
-                li.setData(QtCore.Qt.UserRole, p)
-                li.setData(QtCore.Qt.UserRole + 1, "poster-row")
+        for kind, tpl, p in rows[reuse:]:
+            self._append_queue_row(kind, tpl, p)
 
-                frame = self._build_queue_poster_row_widget(p)
-                li.setSizeHint(frame.sizeHint())
+        self._queue_row_kinds = [kind for kind, _, _ in rows]
+        self._last_queue_fingerprint = fingerprint
 
-                self.queue_list.addItem(li)
-                self.queue_list.setItemWidget(li, frame)
+        self.queue_list.clearSelection()
+        if selected_keys:
+            for i in range(self.queue_list.count()):
+                li = self.queue_list.item(i)
+                if self._queue_item_key(li) in selected_keys:
+                    li.setSelected(True)
 
         posters_count = len(items or [])
         self.lbl_summary.setText(
@@ -747,21 +773,40 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         )
 
         self.queue_list.setUpdatesEnabled(True)
-        self._sync_queue_row_selection_props()
 
-    # =================================================
-    # Selection syncing (properties only; theme controls visuals)
-    # =====================================================
-
-    def _sync_queue_row_selection_props(self) -> None:
-        for i in range(self.queue_list.count()):
-            item = self.queue_list.item(i)
-            widget = self.queue_list.itemWidget(item)
-            if not widget:
-                continue
+    def _append_queue_row(self, kind: str, tpl: str, payload: Optional[dict]) -> None:
+        li = QtWidgets.QListWidgetItem()
+        li.setData(QtCore.Qt.UserRole + 1, kind)
+
+        if kind == "template-header":
+            li.setData(QtCore.Qt.UserRole, None)  # critical for delete semantics
+            li.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable)
+
+        self.queue_list.addItem(li)
+        self._refresh_queue_row(self.queue_list.count() - 1, kind, tpl, payload)
+
+    @staticmethod
+    def _queue_item_key(li: QtWidgets.QListWidgetItem) -> tuple:
+        """Identity of a queue row across re-renders: template for headers, (path, template) for posters."""
+        kind = li.data(QtCore.Qt.UserRole + 1)
+        if kind == "template-header":
+            return (kind, li.data(QtCore.Qt.UserRole + 2))
+        payload = li.data(QtCore.Qt.UserRole) or {}
+        return (kind, payload.get("path"), payload.get("template"))
+
+    def _refresh_queue_row(self, row: int, kind: str, tpl: str, payload: Optional[dict]) -> None:
+        """Point an existing row at new data (painted by QueueRowDelegate)."""
+        li = self.queue_list.item(row)
 
-            widget.setProperty("selected", bool(item.isSelected()))
-            repolish(widget)
+        if kind == "template-header":
+            li.setData(QtCore.Qt.UserRole + 2, tpl)
+            text = tpl or "-- No Template --"
+        else:
+            li.setData(QtCore.Qt.UserRole, payload)
+            text = (payload or {}).get("name", "")
+
+        if li.text() != text:
+            li.setText(text)
 
     # =================================================
     # Deletion handling
@@ -773,64 +818,36 @@ class MockupGeneratorViewQt(QtWidgets.QFrame):
         Supports:
           - poster row delete (dict payload)
           - template header delete (remove all posters under that template)
-          - ignores spacers
         """
         if not selected_items:
             return
 
-        # Snapshot current queue dicts from the list widget
-        all_queue_dicts: list[dict] = []
-        for i in range(self.queue_list.count()):
-            li = self.queue_list.item(i)
-            data = li.data(QtCore.Qt.UserRole)
-            if isinstance(data, dict):
-                all_queue_dicts.append(data)
+        # Deduplicate by (path, template) while collecting; dicts keep insertion order
+        unique: dict[tuple, dict] = {}
 
-        to_remove: list[dict] = []
+        def _add(d: dict) -> None:
+            unique.setdefault((d.get("path"), d.get("template")), d)
 
         for item in selected_items:
             kind = item.data(QtCore.Qt.UserRole + 1)  # "poster-row" | "template-header" | None
             data = item.data(QtCore.Qt.UserRole)
 
-            # Spacer / non-selectable rows: ignore defensively
-            if item.flags() == QtCore.Qt.NoItemFlags:
-                continue
-
             # Poster row
             if kind == "poster-row" and isinstance(data, dict):
-                to_remove.append(data)
+                _add(data)
                 continue
 
             # Template header
             if kind == "template-header":
-                # For widget rows, item.text() is empty; derive from the widget label if needed.
-                template_name = item.text()
-                if not template_name:
-                    w = self.queue_list.itemWidget(item)
-                    if w is not None:
-                        # Best-effort: first QLabel text
-                        lbls = w.findChildren(QtWidgets.QLabel)
-                        if lbls:
-                            template_name = lbls[0].text()
-
-                for d in all_queue_dicts:
-                    if (d.get("template") or "-- No Template --") == template_name:
-                        to_remove.append(d)
+                # Template name is stored on the header item in set_queue
+                template_name = item.data(QtCore.Qt.UserRole + 2) or ""
+                for d in self._queue_by_template.get(template_name, ()):
+                    _add(d)
                 continue
 
             # Fallback: if user selected something weird but it has dict payload
             if isinstance(data, dict):
-                to_remove.append(data)
-
-        # Deduplicate by (path, template) to match your previous behavior
-        seen = set()
-        unique: list[dict] = []
-        for d in to_remove:
-            key = (d.get("path"), d.get("template"))
-            if key in seen:
-                continue
-            seen.add(key)
-            unique.append(d)
+                _add(data)
 
         if unique:
-            self.queue_remove_requested.emit(unique)
\ No newline at end of file
+            self.queue_remove_requested.emit(list(unique.values()))
\ No newline at end of file
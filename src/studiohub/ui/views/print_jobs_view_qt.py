@@ -8,6 +8,7 @@ from studiohub.models.print_jobs_model_qt import (
     PrintJobsModelQt,
     PrintJobRecord,
     ROLE_JOB,
+    planned_length_for,
 )
 
 from studiohub.models.print_manager_model_qt import PrintManagerModelQt
@@ -43,6 +44,12 @@ class PrintJobsViewQt(QtWidgets.QFrame):
     COL_FAILED = 7
 
     FIXED_COL_WIDTH = 92
+    FIXED_COLS = (COL_FORMAT, COL_LENGTH, COL_COST, COL_STATUS, COL_FAILED)
+
+    # Widest possible Time cell; sized once instead of ResizeToContents over all rows
+    TIME_SAMPLE = "12/31/2025 12:00 PM"
+    TIME_COL_PADDING = 24
+    REFRESH_INTERVAL_MS = 16
 
     def __init__(
         self,
@@ -61,6 +68,13 @@ class PrintJobsViewQt(QtWidgets.QFrame):
         self.print_manager_model = print_manager_model
 
         self._dialog_open = False
+        self._failed_dlg: PrintFailedDialog | None = None
+        self._reprint_dlg: ReprintDialog | None = None
+
+        # Coalesce bursts of ledger changes into one repaint per frame
+        self._refresh_timer = QtCore.QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(self.REFRESH_INTERVAL_MS)
 
         self.setObjectName("PrintJobsView")
         self.setAttribute(Qt.WA_StyledBackground, True)
@@ -81,7 +95,8 @@ class PrintJobsViewQt(QtWidgets.QFrame):
         self.table.setObjectName("PrintJobsTable")
 
         self.table.setSortingEnabled(False)
-        self.table.setAlternatingRowColors(True)
+        # Striping comes from the model's BackgroundRole (see _sync_alternate_background)
+        self.table.setAlternatingRowColors(False)
         self.table.setShowGrid(False)
         self.table.setWordWrap(False)
 
@@ -89,8 +104,12 @@ class PrintJobsViewQt(QtWidgets.QFrame):
         self.table.setSelectionMode(QtWidgets.QAbstractItemView.NoSelection)
         self.table.setSelectionBehavior(QtWidgets.QAbstractItemView.SelectRows)
 
-        self.table.verticalHeader().setVisible(False)
-        self.table.verticalHeader().setDefaultSectionSize(self.ROW_HEIGHT)
+        # Fixed row height: rows are never measured individually (QTableView's
+        # equivalent of uniform row heights)
+        vh = self.table.verticalHeader()
+        vh.setVisible(False)
+        vh.setSectionResizeMode(QtWidgets.QHeaderView.Fixed)
+        vh.setDefaultSectionSize(self.ROW_HEIGHT)
 
         header = self.table.horizontalHeader()
         header.setFixedHeight(self.HEADER_HEIGHT)
@@ -116,17 +135,16 @@ class PrintJobsViewQt(QtWidgets.QFrame):
         # -----------------------------
         # Column sizing
         # -----------------------------
-        header.setSectionResizeMode(self.COL_TIME, QtWidgets.QHeaderView.ResizeToContents)
+        header.setSectionResizeMode(self.COL_TIME, QtWidgets.QHeaderView.Fixed)
+        self.table.setColumnWidth(
+            self.COL_TIME,
+            self.table.fontMetrics().horizontalAdvance(self.TIME_SAMPLE) + self.TIME_COL_PADDING,
+        )
+
         header.setSectionResizeMode(self.COL_FILE_A, QtWidgets.QHeaderView.Stretch)
         header.setSectionResizeMode(self.COL_FILE_B, QtWidgets.QHeaderView.Stretch)
 
-        for col in (
-            self.COL_FORMAT,
-            self.COL_LENGTH,
-            self.COL_COST,
-            self.COL_STATUS,
-            self.COL_FAILED,
-        ):
+        for col in self.FIXED_COLS:
             header.setSectionResizeMode(col, QtWidgets.QHeaderView.Fixed)
             self.table.setColumnWidth(col, self.FIXED_COL_WIDTH)
 
@@ -138,27 +156,39 @@ class PrintJobsViewQt(QtWidgets.QFrame):
         self.table.setItemDelegateForColumn(self.COL_FAILED, delegate)
 
         repolish(self)
+        self._sync_alternate_background()
+
+    @QtCore.Slot()
+    def _sync_alternate_background(self) -> None:
+        # QSS alternate-background-color lands in the polished table palette
+        self.model.set_alternate_background(self.table.palette().alternateBase())
+
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() in (QtCore.QEvent.StyleChange, QtCore.QEvent.PaletteChange):
+            # Children are re-polished after us; read the palette once they are
+            QtCore.QTimer.singleShot(0, self._sync_alternate_background)
 
     # -------------------------------------------------
     # Signals
     # -------------------------------------------------
 
     def _wire_signals(self) -> None:
-        self.print_log_state.changed.connect(self.refresh)
-        self.paper_ledger.changed.connect(self.refresh)
-
-    # -------------------------------------------------
-    # Public API
-    # -------------------------------------------------
+        # Both sources repaint through the model (row- / column-scoped dataChanged);
+        # print-log changes are wired inside the model, ledger changes are debounced here
+        self._refresh_timer.timeout.connect(self.model.on_ledger_changed)
+        self.paper_ledger.changed.connect(self._schedule_ledger_repaint)
 
-    def refresh(self) -> None:
-        self.table.viewport().update()
-        repolish(self)
+    @QtCore.Slot()
+    def _schedule_ledger_repaint(self) -> None:
+        """Restart the debounce timer; N ledger edits within one interval repaint once."""
+        self._refresh_timer.start()
 
     # -------------------------------------------------
     # Delegate actions
     # -------------------------------------------------
 
+    @QtCore.Slot(QtCore.QModelIndex, str)
     def _on_failed_action(self, index: QtCore.QModelIndex, action: str) -> None:
         if self._dialog_open or not index.isValid():
             return
@@ -179,20 +209,26 @@ class PrintJobsViewQt(QtWidgets.QFrame):
     def _open_failed_dialog(self, job: PrintJobRecord) -> None:
         self._dialog_open = True
         try:
-            dlg = PrintFailedDialog(
-                self,
-                job_id=job.timestamp.isoformat(),
-                display_time=job.timestamp.strftime("%m/%d/%Y %I:%M %p"),
-                file_a=job.files[0]["poster_id"] if job.files else "",
-                file_b=job.files[1]["poster_id"] if len(job.files) > 1 else None,
-                planned_in=self._planned_length_for(job),
+            fields = dict(
+                job_id=job.iso,
+                display_time=job.display,
+                file_a=job.files[0].poster_id if job.files else "",
+                file_b=job.files[1].poster_id if len(job.files) > 1 else None,
+                planned_in=planned_length_for(job),
             )
 
+            # Built on first use, then reset and reused
+            dlg = self._failed_dlg
+            if dlg is None:
+                dlg = self._failed_dlg = PrintFailedDialog(self, **fields)
+            else:
+                dlg.reset(**fields)
+
             if dlg.exec() != QtWidgets.QDialog.Accepted:
                 return
 
             self.print_log_state.record_failure(
-                job_id=job.timestamp.isoformat(),
+                job_id=job.iso,
                 actual_in=dlg.get_actual_in(),
                 reason=dlg.get_reason(),
             )
@@ -203,21 +239,27 @@ class PrintJobsViewQt(QtWidgets.QFrame):
     def _open_reprint_dialog(self, job: PrintJobRecord) -> None:
         self._dialog_open = True
         try:
-            dlg = ReprintDialog(self, job=job)
+            dlg = self._reprint_dlg
+            if dlg is None:
+                dlg = self._reprint_dlg = ReprintDialog(self, job=job)
+            else:
+                dlg.reset(job)
             if dlg.exec() != QtWidgets.QDialog.Accepted:
                 return
 
             request = dlg.get_request()
 
-            # 1) Send to Photoshop via PrintManager pathway (no duplication)
-            self._send_reprint_to_photoshop(request)
+            # One reload / `changed` for the whole reprint, however many log writes it makes
+            with self.print_log_state.batch():
+                # 1) Send to Photoshop via PrintManager pathway (no duplication)
+                self._send_reprint_to_photoshop(request)
 
-            # 2) Mark the ORIGINAL job as reprinted (event)
-            self.print_log_state.record_reprint(
-                parent_job_id=request.parent_job_id,
-                reprinted_at=request.timestamp,
-                reprint_job_id=request.timestamp.isoformat(),
-            )
+                # 2) Mark the ORIGINAL job as reprinted (event)
+                self.print_log_state.record_reprint(
+                    parent_job_id=request.parent_job_id,
+                    reprinted_at=request.timestamp,
+                    reprint_job_id=request.timestamp.isoformat(),
+                )
 
         finally:
             self._dialog_open = False
@@ -239,22 +281,3 @@ class PrintJobsViewQt(QtWidgets.QFrame):
         }
 
         self.print_manager_model.send_reprint_job(payload)
-
-    # -------------------------------------------------
-    # Utilities
-    # -------------------------------------------------
-
-    @staticmethod
-    def _planned_length_for(job: PrintJobRecord) -> float:
-        mode = (job.mode or "").lower()
-        size = job.size
-
-        if mode == "2up":
-            return 24.0
-        if size == "12x18":
-            return 18.0
-        if size == "18x24":
-            return 24.0
-        if size == "24x36":
-            return 36.0
-        return 0.0
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Optional, List
+import json
+from typing import Callable, Dict, Optional, List
 
 from PySide6 import QtCore, QtGui, QtWidgets
 from PySide6.QtCore import Qt
@@ -8,6 +9,7 @@ from PySide6.QtCore import Qt
 from studiohub.constants import PRINT_SIZES, PRINT_SIZES_DISPLAY
 from studiohub.ui.layout.row_layout import configure_view, RowProfile
 from studiohub.ui.layout.queue import QueueRowFactory
+from studiohub.ui.delegates.queue_row_delegate import PrintQueueRowDelegate
 
 from studiohub.style.typography.rules import apply_view_typography, apply_typography
 from PySide6.QtGui import QFont
@@ -18,106 +20,277 @@ logger = get_logger(__name__)
 
 HEADER_HEIGHT = 40
 
+# Drag payload from the available trees: JSON list of poster dicts
+POSTER_ITEMS_MIME = "application/x-studiohub-tree"
+
+# Row flags are the same for every row; built once, not per flags() call
+_POSTER_ROW_FLAGS = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsDragEnabled
+_QUEUE_ROW_FLAGS = QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable
+
 # =====================================================
-# Styling helpers
+# Available Posters Model (drag source)
 # =====================================================
 
-def repolish(w: QtWidgets.QWidget) -> None:
-    """Force Qt to re-evaluate stylesheet for this widget."""
-    style = w.style()
-    style.unpolish(w)
-    style.polish(w)
-    w.update()
+class PostersModel(QtCore.QAbstractListModel):
+    """
+    Flat poster list backing an available-posters tree.
+
+    Wraps the cached poster dicts for the active size directly (no per-row
+    item objects). A background filter is a precomputed index array over
+    them, optionally with precomputed display names.
+
+    Contract:
+    - DisplayRole -> display name (poster name by default)
+    - UserRole    -> poster dict
+    - Drags carry the poster dicts as JSON under POSTER_ITEMS_MIME
+    """
+
+    def __init__(self, parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._items: List[dict] = []
+        self._rows: List[int] = []
+        self._names: Optional[List[str]] = None
+
+    def set_items(
+        self,
+        items: List[dict],
+        rows: Optional[List[int]] = None,
+        names: Optional[List[str]] = None,
+    ) -> None:
+        """
+        rows:  indexes into items to show (all when None)
+        names: display names parallel to items (poster names when None)
+        """
+        self.beginResetModel()
+        self._items = items or []
+        self._rows = list(range(len(self._items))) if rows is None else rows
+        self._names = names
+        self.endResetModel()
+
+    # -------------------------------------------------
+    # Qt model API
+    # -------------------------------------------------
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        i = self._rows[index.row()]
+        it = self._items[i]
+        if role == QtCore.Qt.DisplayRole:
+            return self._names[i] if self._names is not None else it.get("name", "")
+        if role == QtCore.Qt.UserRole:
+            return it
+        return None
+
+    def flags(self, index: QtCore.QModelIndex) -> QtCore.Qt.ItemFlags:
+        if not index.isValid():
+            return QtCore.Qt.NoItemFlags
+        return _POSTER_ROW_FLAGS
+
+    def supportedDragActions(self) -> QtCore.Qt.DropActions:
+        return QtCore.Qt.CopyAction
+
+    def mimeTypes(self) -> List[str]:
+        return [POSTER_ITEMS_MIME]
+
+    def mimeData(self, indexes) -> QtCore.QMimeData:
+        payload = [
+            self._items[self._rows[idx.row()]]
+            for idx in indexes
+            if idx.isValid()
+        ]
+        mime = QtCore.QMimeData()
+        mime.setData(POSTER_ITEMS_MIME, QtCore.QByteArray(json.dumps(payload).encode("utf-8")))
+        return mime
+
+
+# =====================================================
+# Queue Model (one row per print: single job or 12x18 pair)
+# =====================================================
+
+class QueueModel(QtCore.QAbstractListModel):
+    """
+    Flat list model for the print queue.
+
+    Rows are plain Python payloads (list[dict]); nothing is stored per role
+    and rows are painted by PrintQueueRowDelegate. Ordering is owned by the
+    hub, so the model only accepts drops from the available trees (handled
+    by QueueList) and never reorders itself.
+    """
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._rows: list[list[dict]] = []
+        # Human-readable row labels, built on first use per row
+        self._labels: list[str | None] = []
+
+    def set_rows(self, rows: list[list[dict]]) -> None:
+        self.beginResetModel()
+        self._rows = rows
+        self._labels = [None] * len(rows)
+        self.endResetModel()
+
+    def rows(self) -> list[list[dict]]:
+        return self._rows
+
+    def label(self, row: int) -> str:
+        """Row label in the form 'Name A / Name B — 12×18' (cached)."""
+        label = self._labels[row]
+        if label is None:
+            payload = self._rows[row]
+            names = [p.get("name", "Untitled") for p in payload]
+            size = payload[0].get("size", "").replace("x", "×") if payload else ""
+            label = self._labels[row] = " / ".join(names) + (f" — {size}" if size else "")
+        return label
+
+    # -------------------------------------------------
+    # Qt model API
+    # -------------------------------------------------
+
+    def rowCount(self, parent=QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def data(self, index: QtCore.QModelIndex, role=QtCore.Qt.DisplayRole):
+        if not index.isValid():
+            return None
+        row = index.row()
+
+        if role == QtCore.Qt.DisplayRole:
+            return self.label(row)
+        if role == QtCore.Qt.UserRole:
+            return self._rows[row]
+        return None
+
+    def flags(self, index: QtCore.QModelIndex):
+        if not index.isValid():
+            # Dropping onto empty space appends via the hub
+            return QtCore.Qt.ItemIsDropEnabled
+        return _QUEUE_ROW_FLAGS
+
+    def supportedDropActions(self):
+        return QtCore.Qt.CopyAction | QtCore.Qt.MoveAction
+
+    def mimeTypes(self) -> list[str]:
+        # Only poster drags from the available trees are accepted
+        return [POSTER_ITEMS_MIME]
+
+    def removeRows(self, row: int, count: int, parent=QtCore.QModelIndex()) -> bool:
+        if parent.isValid() or row < 0 or count <= 0 or row + count > len(self._rows):
+            return False
+        self.beginRemoveRows(parent, row, row + count - 1)
+        del self._rows[row:row + count]
+        del self._labels[row:row + count]
+        self.endRemoveRows()
+        return True
+
 
 # =====================================================
 # Queue Widget (Drag + Drop aware)
 # =====================================================
 
-class QueueList(QtWidgets.QListWidget):
+class QueueList(QtWidgets.QListView):
     items_dropped = QtCore.Signal(list)
     remove_requested = QtCore.Signal(list)  # list[str] paths
 
+    # Enum values resolved once, not per input event
+    _DELETE_KEYS = frozenset((int(QtCore.Qt.Key_Delete), int(QtCore.Qt.Key_Backspace)))
+    _MOUSE_FOCUS = QtCore.Qt.MouseFocusReason
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        self._model = QueueModel(self)
+        self.setModel(self._model)
+
+        # Queue order is owned by the hub: accept drops from the trees only
         self.setAcceptDrops(True)
-        self.setDragEnabled(True)
         self.setDropIndicatorShown(True)
         self.setDefaultDropAction(QtCore.Qt.MoveAction)
-        self.setDragDropMode(QtWidgets.QAbstractItemView.DragDrop)
+        self.setDragDropMode(QtWidgets.QAbstractItemView.DropOnly)
         self.setSelectionMode(QtWidgets.QAbstractItemView.ExtendedSelection)
 
-        # Ensure this widget can take focus + receive shortcut context
+        # Ensure this widget can take focus (Delete / Backspace in keyPressEvent)
         self.setFocusPolicy(QtCore.Qt.StrongFocus)
 
-        # -------------------------------------------------
-        # Reliable Delete / Backspace handling (QShortcut)
-        # -------------------------------------------------
-        self._delete_shortcut = QtGui.QShortcut(QtGui.QKeySequence.Delete, self)
-        self._delete_shortcut.setContext(QtCore.Qt.WidgetWithChildrenShortcut)
-        self._delete_shortcut.activated.connect(self._on_delete)
+        # Optional in-process drop handler; items_dropped is emitted otherwise
+        self._direct_drop_handler: Optional[Callable[[list], None]] = None
 
-        self._backspace_shortcut = QtGui.QShortcut(
-            QtGui.QKeySequence(QtCore.Qt.Key_Backspace),
-            self
-        )
-        self._backspace_shortcut.setContext(QtCore.Qt.WidgetWithChildrenShortcut)
-        self._backspace_shortcut.activated.connect(self._on_delete)
+    # -------------------------------------------------
+    # Rows
+    # -------------------------------------------------
 
-    def mousePressEvent(self, event: QtGui.QMouseEvent):
-        self.setFocus(QtCore.Qt.MouseFocusReason)
+    def set_rows(self, rows: list[list[dict]]) -> None:
+        self._model.set_rows(rows)
+
+    def set_drop_handler(self, handler: Optional[Callable[[list], None]]) -> None:
+        """Route dropped items straight to handler instead of items_dropped."""
+        self._direct_drop_handler = handler
+
+    def clear(self) -> None:
+        self._model.set_rows([])
 
-        # Ensure the clicked visual row sets a real QListWidgetItem as current/selected
-        pos = event.position().toPoint() if hasattr(event, "position") else event.pos()
-        item = self.itemAt(pos)
-        if item is not None:
-            self.setCurrentItem(item)
-            if not item.isSelected():
-                item.setSelected(True)
+    def row_payloads(self) -> list[list[dict]]:
+        return self._model.rows()
 
+    def row_label(self, row: int) -> str:
+        return self._model.label(row)
+
+    def mousePressEvent(self, event: QtGui.QMouseEvent):
+        # Take focus so Delete/Backspace reach keyPressEvent; selection is the base class's job
+        if not self.hasFocus():
+            self.setFocus(self._MOUSE_FOCUS)
         super().mousePressEvent(event)
 
+    def keyPressEvent(self, event: QtGui.QKeyEvent):
+        # Delete / Backspace handled directly: no shortcut-map registration
+        if event.key() in self._DELETE_KEYS:
+            self._on_delete()
+            event.accept()
+            return
+
+        super().keyPressEvent(event)
+
+    @QtCore.Slot()
     def _on_delete(self):
-        selected = self.selectedItems()
+        selected = self.selectedIndexes()
         if not selected:
             return
 
-        paths_to_remove: list[str] = []
-        for item in selected:
-            payload = item.data(QtCore.Qt.UserRole) or []
-            for p in payload:
-                path = p.get("path")
-                if path:
-                    paths_to_remove.append(path)
-
-        # Deduplicate while preserving order
-        seen = set()
-        uniq = []
-        for p in paths_to_remove:
-            if p not in seen:
-                seen.add(p)
-                uniq.append(p)
+        payloads = self._model.rows()
+
+        # Deduplicate while preserving order, straight from the generator
+        uniq = list(dict.fromkeys(
+            p["path"]
+            for idx in selected
+            for p in payloads[idx.row()]
+            if p.get("path")
+        ))
 
         if uniq:
             self.remove_requested.emit(uniq)
 
     def dropEvent(self, event: QtGui.QDropEvent):
-        source = event.source()
-
-        if isinstance(source, QtWidgets.QTreeWidget):
-            items = []
-            for it in source.selectedItems():
-                data = it.data(0, QtCore.Qt.UserRole)
-                if data:
-                    items.append(data)
+        md = event.mimeData()
 
+        if md.hasFormat(POSTER_ITEMS_MIME):
+            items = json.loads(bytes(md.data(POSTER_ITEMS_MIME)).decode("utf-8"))
             if items:
-                self.items_dropped.emit(items)
+                handler = self._direct_drop_handler
+                if handler is not None:
+                    handler(items)
+                else:
+                    self.items_dropped.emit(items)
 
             event.acceptProposedAction()
             return
 
-        super().dropEvent(event)
+        event.ignore()
 
 
 # =====================================================
@@ -170,10 +343,20 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         self._active_size = PRINT_SIZES[0]  # "12x18"
         self._avail_sig = {"archive": -1, "studio": -1}
         self._data_cache = {"archive": {}, "studio": {}}
+        # An empty cache after a finished scan is a real (empty) result, not "never scanned"
+        self._scan_completed = {"archive": False, "studio": False}
+        # source -> size -> (short display names, background label -> row indexes)
+        self._filter_index: dict[str, dict[str, tuple[list[str], dict[str, list[int]]]]] = {
+            "archive": {},
+            "studio": {},
+        }
         self._current_bg_filter: Optional[str] = None
-        self._background_buttons: List[QtWidgets.QPushButton] = []
+        # bg label -> filter button; buttons are kept and hidden, never rebuilt
+        self._background_buttons: Dict[str, QtWidgets.QPushButton] = {}
+        self._bg_cache_sig: Optional[int] = None
         self._background_button_group = QtWidgets.QButtonGroup(self)
         self._background_button_group.setExclusive(False)  # Allow toggling off
+        self._refresh_pending = False
 
         # -------------------------------------------------
         # Model auto-binding (hub-side wiring safety)
@@ -199,15 +382,17 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         self.btn_18x24.setText(PRINT_SIZES_DISPLAY[PRINT_SIZES[1]])  # "18×24"
         self.btn_24x36.setText(PRINT_SIZES_DISPLAY[PRINT_SIZES[2]])  # "24×36"
 
+        # One shared toggle font (implicitly shared by every button)
+        self._toggle_font = QFont(self.btn_archive.font())
+        self._toggle_font.setPointSize(9)
+
         # Configure source buttons
         for b in (self.btn_archive, self.btn_studio):
             b.setCheckable(True)
             b.setMinimumWidth(80)
             b.setObjectName("SourceToggle")
             b.setCursor(QtCore.Qt.PointingHandCursor)
-            font = b.font()
-            font.setPointSize(9)
-            b.setFont(font)
+            b.setFont(self._toggle_font)
 
         # Configure size buttons
         for b in (self.btn_12x18, self.btn_18x24, self.btn_24x36):
@@ -215,9 +400,7 @@ class PrintManagerViewQt(QtWidgets.QFrame):
             b.setMinimumWidth(70)
             b.setObjectName("SourceToggle")
             b.setCursor(QtCore.Qt.PointingHandCursor)
-            font = b.font()
-            font.setPointSize(9)
-            b.setFont(font)
+            b.setFont(self._toggle_font)
 
         self.btn_12x18.setChecked(True)
 
@@ -233,28 +416,27 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         self.btn_clear.setObjectName("SourceToggle")
         self.btn_clear.setProperty("danger", True)
         self.btn_clear.setCursor(QtCore.Qt.PointingHandCursor)
-        
-        font = self.btn_clear.font()
-        font.setPointSize(9)
-        self.btn_clear.setFont(font)
+        self.btn_clear.setFont(self._toggle_font)
 
         self.btn_reprint = QtWidgets.QPushButton("Reprint Last Batch")
         self.btn_reprint.setObjectName("SourceToggle")
         self.btn_reprint.setEnabled(False)
         self.btn_reprint.setVisible(False)
-        self.btn_reprint.setFont(font)
+        self.btn_reprint.setFont(self._toggle_font)
 
         self.btn_send = QtWidgets.QPushButton("Send to Photoshop")
         self.btn_send.setProperty("primary", True)
         self.btn_send.setObjectName("SourceToggle")
-        self.btn_send.setFont(font)
+        self.btn_send.setFont(self._toggle_font)
 
         # DATA VIEWS
-        self.available_stack = QtWidgets.QStackedWidget()
-        self.tree_archive = self._build_available_tree()
-        self.tree_studio = self._build_available_tree()
-        self.available_stack.addWidget(self.tree_archive)
-        self.available_stack.addWidget(self.tree_studio)
+        # One tree; each source keeps its own model and switching swaps models
+        self._poster_models = {
+            "archive": PostersModel(self),
+            "studio": PostersModel(self),
+        }
+        self.tree_available = self._build_available_tree()
+        self.tree_available.setModel(self._poster_models[self._source])
 
         self.list_queue = QueueList()
         try:
@@ -262,12 +444,20 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         except:
             pass
 
+        # Queue rows are painted, not built from per-row widgets
+        self._queue_delegate = PrintQueueRowDelegate(
+            self.list_queue,
+            badge_width=self.BADGE_WIDTH,
+            indicator_width=self.INDICATOR_WIDTH,
+        )
+        self.list_queue.setItemDelegate(self._queue_delegate)
+
         # =================================================
         # SIGNAL WIRING (WIDGETS EXIST, LAYOUTS NOT YET)
         # =================================================
         
-        self.btn_archive.clicked.connect(lambda: self._set_source("archive"))
-        self.btn_studio.clicked.connect(lambda: self._set_source("studio"))
+        self.btn_archive.clicked.connect(self._on_source_archive)
+        self.btn_studio.clicked.connect(self._on_source_studio)
 
         source_group = QtWidgets.QButtonGroup(self)
         source_group.setExclusive(True)
@@ -280,28 +470,24 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         size_group.addButton(self.btn_18x24)
         size_group.addButton(self.btn_24x36)
 
-        self.btn_12x18.clicked.connect(lambda: self._set_size(PRINT_SIZES[0]))
-        self.btn_18x24.clicked.connect(lambda: self._set_size(PRINT_SIZES[1]))
-        self.btn_24x36.clicked.connect(lambda: self._set_size(PRINT_SIZES[2]))
+        self.btn_12x18.clicked.connect(self._on_size_12x18)
+        self.btn_18x24.clicked.connect(self._on_size_18x24)
+        self.btn_24x36.clicked.connect(self._on_size_24x36)
 
         self.btn_clear.clicked.connect(self.queue_clear_requested.emit)
         self.btn_send.clicked.connect(self._confirm_and_send)
 
-        self.list_queue.items_dropped.connect(self.queue_add_requested)
+        # Direct call rather than chaining items_dropped -> queue_add_requested
+        self.list_queue.set_drop_handler(self.queue_add_requested.emit)
         self.list_queue.remove_requested.connect(self._on_remove_paths_requested)
-        self.list_queue.itemSelectionChanged.connect(
-            self._sync_queue_row_selection_props
-        )
 
         # =================================================
         # SHARED RESOURCES
         # =================================================
         
-        # Shared, canonical queue row widgets (single source of truth)
-        self._queue_rows = QueueRowFactory(
-            badge_width=self.BADGE_WIDTH,
-            indicator_width=self.INDICATOR_WIDTH,
-        )
+        # Shared, canonical queue row widgets (single source of truth);
+        # only the preview builders use it, so it is created on first use
+        self._queue_rows_factory: Optional[QueueRowFactory] = None
 
         # =================================================
         # BUILD LAYOUT (NOW ALL WIDGETS EXIST)
@@ -338,7 +524,7 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         pt = QtWidgets.QVBoxLayout(posters_table)
         pt.setContentsMargins(0, 0, 0, 0)
         pt.setSpacing(0)
-        pt.addWidget(self.available_stack, 1)
+        pt.addWidget(self.tree_available, 1)
 
         root.addWidget(posters_table, 1, 0)
 
@@ -376,8 +562,6 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         self.btn_archive.setChecked(True)
         self._set_source("archive", emit=False)
 
-        repolish(self)
-
     # =================================================
     # Construction helpers
     # =================================================
@@ -391,9 +575,7 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         btn.setCursor(QtCore.Qt.PointingHandCursor)
         
         # Same font as source toggles
-        font = btn.font()
-        font.setPointSize(9)
-        btn.setFont(font)
+        btn.setFont(self._toggle_font)
         
         btn.setProperty("bg_value", bg_value)
         btn.clicked.connect(lambda checked, val=bg_value: self._on_filter_button_clicked(val))
@@ -449,21 +631,20 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         lbl_items.setProperty("typography", "label")
         sec_layout.addWidget(lbl_items)
 
-        item_checks: list[QtWidgets.QCheckBox] = []
-
-        for i in range(self.list_queue.count()):
-            item = self.list_queue.item(i)
-            payload = item.data(QtCore.Qt.UserRole) or []
+        # Filled on first expand; the common no-reprint send builds no checkboxes
+        items_layout = QtWidgets.QVBoxLayout()
+        items_layout.setContentsMargins(0, 0, 0, 0)
+        items_layout.setSpacing(sec_layout.spacing())
+        sec_layout.addLayout(items_layout)
 
-            # Build a human-readable label
-            names = [p.get("name", "Untitled") for p in payload]
-            size = payload[0].get("size", "").replace("x", "×") if payload else ""
-            label = " / ".join(names) + (f" — {size}" if size else "")
+        item_checks: list[QtWidgets.QCheckBox] = []
 
-            cb = QtWidgets.QCheckBox(label)
-            cb.setProperty("queue_payload", payload)
-            item_checks.append(cb)
-            sec_layout.addWidget(cb)
+        def _populate_item_checks():
+            for row, payload in enumerate(self.list_queue.row_payloads()):
+                cb = QtWidgets.QCheckBox(self.list_queue.row_label(row))
+                cb.setProperty("queue_payload", payload)
+                item_checks.append(cb)
+                items_layout.addWidget(cb)
 
         # ---- Reason radios ----
         sec_layout.addSpacing(10)
@@ -499,6 +680,9 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         # Toggle behavior (expand / collapse + reset)
         # -------------------------------------------------
         def _on_toggle(checked: bool):
+            if checked and not item_checks:
+                _populate_item_checks()
+
             section.setVisible(checked)
 
             if not checked:
@@ -531,34 +715,40 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         # -------------------------------------------------
         # Finalize
         # -------------------------------------------------
-        if dlg.exec() == QtWidgets.QDialog.Accepted:
-            is_reprint = chk_reprint.isChecked()
-
-            # For next phase (not wired yet):
-            if is_reprint:
-                selected_payloads = [
-                    cb.property("queue_payload")
-                    for cb in item_checks
-                    if cb.isChecked()
-                ]
-
-                reason_btn = reason_group.checkedButton()
-                reason = (
-                    reason_btn.property("reason_key")
-                    if reason_btn is not None
-                    else None
-                )
-
-                # selected_payloads + reason ready for logging
-
-            self.send_requested.emit(bool(is_reprint))
-
-
-    def _build_available_tree(self) -> QtWidgets.QTreeWidget:
+        try:
+            if dlg.exec() == QtWidgets.QDialog.Accepted:
+                is_reprint = chk_reprint.isChecked()
+
+                # For next phase (not wired yet):
+                if is_reprint:
+                    selected_payloads = [
+                        cb.property("queue_payload")
+                        for cb in item_checks
+                        if cb.isChecked()
+                    ]
+
+                    reason_btn = reason_group.checkedButton()
+                    reason = (
+                        reason_btn.property("reason_key")
+                        if reason_btn is not None
+                        else None
+                    )
+
+                    # selected_payloads + reason ready for logging
+
+                self.send_requested.emit(bool(is_reprint))
+        finally:
+            # A fresh dialog per Send: destroy it (and every connection made
+            # above) instead of leaving it parented to the view after Cancel
+            dlg.deleteLater()
+
+
+    def _build_available_tree(self) -> QtWidgets.QTreeView:
         rowProfile = RowProfile.STANDARD
 
-        tree = QtWidgets.QTreeWidget()
+        tree = QtWidgets.QTreeView()
         tree.setHeaderHidden(True)
+        tree.setUniformRowHeights(True)
         try:
             apply_view_typography(tree, "tree")
         except:
@@ -574,12 +764,12 @@ class PrintManagerViewQt(QtWidgets.QFrame):
 
         configure_view(tree, profile=rowProfile, role="posters-tree", alternating=True)
 
-        tree.itemDoubleClicked.connect(self._emit_add_selected)
+        tree.doubleClicked.connect(self._emit_add_selected)
         return tree
 
 
-    def _tree_for_source(self, source: str) -> QtWidgets.QTreeWidget:
-        return self.tree_archive if source == "archive" else self.tree_studio
+    def _model_for_source(self, source: str) -> PostersModel:
+        return self._poster_models["archive" if source == "archive" else "studio"]
 
     # =================================================
     # Background Filter Methods
@@ -588,102 +778,84 @@ class PrintManagerViewQt(QtWidgets.QFrame):
     def _update_background_selector(self, source: str):
         """Show/hide filter buttons and populate with unique backgrounds"""
         if source == "archive":
-            # Extract unique backgrounds from archive data
-            backgrounds = set()
-            data = self._data_cache.get("archive", {})
-            for size_items in data.values():
-                for item in size_items:
-                    bg_label = item.get("background_label", "")
-                    if bg_label:
-                        backgrounds.add(bg_label)
-            
-            # Clear existing buttons
-            for btn in self._background_buttons:
-                btn.deleteLater()
-            self._background_buttons.clear()
-            
-            # Remove all buttons from button group
-            for btn in self._background_button_group.buttons():
-                self._background_button_group.removeButton(btn)
-            
-            # Sort backgrounds alphabetically and create buttons
-            if backgrounds:
-                for bg in sorted(backgrounds):
-                    btn = self._create_filter_button(bg, bg)
-                    self.filter_layout.addWidget(btn)
-                    self._background_buttons.append(btn)
-                
-                # Show filter container
-                self.filter_container.setVisible(True)
-            else:
-                self.filter_container.setVisible(False)
+            # Unique backgrounds come straight from the precomputed filter index
+            backgrounds = {
+                bg_label
+                for _, by_bg in self._filter_index.get("archive", {}).values()
+                for bg_label in by_bg
+                if bg_label
+            }
             
-            # No filter active by default
+            new_bgs = sorted(backgrounds)
+            sig = hash(tuple(new_bgs))
+
+            if sig != self._bg_cache_sig:
+                self._bg_cache_sig = sig
+                self._sync_filter_buttons(new_bgs)
+
+            self.filter_container.setVisible(bool(new_bgs))
+
+            # No filter active by default (at most one button is checked)
+            prev = self._current_bg_filter
             self._current_bg_filter = None
+            prev_btn = self._background_buttons.get(prev) if prev else None
+            if prev_btn is not None:
+                prev_btn.setChecked(False)
         else:
             self.filter_container.setVisible(False)
 
+    def _sync_filter_buttons(self, new_bgs: List[str]) -> None:
+        """Create missing buttons, hide stale ones, keep alphabetical order."""
+        wanted = set(new_bgs)
+
+        for bg, btn in self._background_buttons.items():
+            if bg not in wanted:
+                btn.hide()
+
+        for pos, bg in enumerate(new_bgs):
+            btn = self._background_buttons.get(bg)
+            if btn is None:
+                btn = self._create_filter_button(bg, bg)
+                self._background_buttons[bg] = btn
+
+            if self.filter_layout.indexOf(btn) != pos:
+                self.filter_layout.removeWidget(btn)
+                self.filter_layout.insertWidget(pos, btn)
+            btn.show()
+
     def _on_filter_button_clicked(self, bg_value: str):
         """Handle filter button clicks - toggle on/off"""
         if self._source != "archive":
             return
         
         # If clicking the same button, clear filter
-        if self._current_bg_filter == bg_value:
-            self._current_bg_filter = None
-            # Uncheck all buttons
-            for btn in self._background_button_group.buttons():
-                btn.setChecked(False)
-        else:
-            # Uncheck all buttons first
-            for btn in self._background_button_group.buttons():
-                btn.setChecked(False)
-            # Set new filter and check the clicked button
-            self._current_bg_filter = bg_value
-            # Find and check the button with this bg_value
-            for btn in self._background_button_group.buttons():
-                if btn.property("bg_value") == bg_value:
-                    btn.setChecked(True)
-                    break
+        prev = self._current_bg_filter
+        self._current_bg_filter = None if prev == bg_value else bg_value
+
+        # Only the previous and the new button can change state
+        prev_btn = self._background_buttons.get(prev) if prev else None
+        if prev_btn is not None:
+            prev_btn.setChecked(False)
+
+        new_btn = self._background_buttons.get(bg_value)
+        if new_btn is not None:
+            new_btn.setChecked(self._current_bg_filter == bg_value)
         
         self._refresh_current_tree()
 
-    def _populate_tree_with_filter(self, tree: QtWidgets.QTreeWidget, data: dict, bg_filter: Optional[str] = None):
-        """Populate tree with optional background filter"""
-        tree.setUpdatesEnabled(False)
-        tree.blockSignals(True)
-        tree.setSortingEnabled(False)
-        tree.clear()
+    def _populate_tree_with_filter(self, source: str, bg_filter: Optional[str] = None):
+        """Populate a source's model with optional background filter (one model reset)"""
+        model = self._model_for_source(source)
+        items = (self._data_cache.get(source) or {}).get(self._active_size, []) or []
 
-        items = (data or {}).get(self._active_size, []) or []
-        
-        for it in items:
-            # Apply background filter if set
-            if bg_filter and it.get("background_label", "") != bg_filter:
-                continue
-            
-            # When a specific filter is active, show only the poster name without background
-            if bg_filter:
-                full_name = it.get("name", "")
-                # Remove everything after " — " if it exists
-                if " — " in full_name:
-                    display_name = full_name.split(" — ")[0]
-                else:
-                    display_name = full_name
-            else:  # No filter active - show full names with backgrounds
-                display_name = it.get("name", "")
-                
-            row = QtWidgets.QTreeWidgetItem([display_name])
-            row.setData(0, QtCore.Qt.UserRole, it)
-            row.setFlags(
-                QtCore.Qt.ItemIsEnabled
-                | QtCore.Qt.ItemIsSelectable
-                | QtCore.Qt.ItemIsDragEnabled
-            )
-            tree.addTopLevelItem(row)
+        entry = self._filter_index.get(source, {}).get(self._active_size)
+        if not bg_filter or entry is None:
+            model.set_items(items)
+            return
 
-        tree.blockSignals(False)
-        tree.setUpdatesEnabled(True)
+        # When a specific filter is active, show only the poster name without background
+        short_names, by_bg = entry
+        model.set_items(items, by_bg.get(bg_filter, []), short_names)
 
     # =================================================
     # Public API
@@ -756,19 +928,40 @@ class PrintManagerViewQt(QtWidgets.QFrame):
 
         self.source_changed.emit(self.current_source())
 
+    def changeEvent(self, event: QtCore.QEvent) -> None:
+        super().changeEvent(event)
+        if event.type() in (QtCore.QEvent.StyleChange, QtCore.QEvent.PaletteChange):
+            # Theme switch: drop cached queue colors so the next paint re-resolves them
+            self._queue_delegate.invalidate_colors()
+            self.list_queue.viewport().update()
 
 
 
-    def _data_signature(self, data: dict) -> int:
-        parts: List[str] = []
-        for size in PRINT_SIZES:
-            for it in (data or {}).get(size, []) or []:
-                parts.append(f"{size}|{it.get('path','')}|{it.get('name','')}")
-        return hash("\n".join(parts))
 
-    def _populate_tree(self, tree: QtWidgets.QTreeWidget, data: dict):
+    def _data_signature(self, data: dict) -> int:
+        # Hash a tuple of field tuples: no per-item formatted strings or join
+        return hash(tuple(
+            (size, it.get("path", ""), it.get("name", ""))
+            for size in PRINT_SIZES
+            for it in (data or {}).get(size, []) or []
+        ))
+
+    def _populate_tree(self, source: str):
         """Standard tree population (no filter)"""
-        self._populate_tree_with_filter(tree, data, None)
+        self._populate_tree_with_filter(source, None)
+
+    @staticmethod
+    def _build_filter_index(data: dict) -> dict[str, tuple[list[str], dict[str, list[int]]]]:
+        """Per size: short display names and row indexes grouped by background label."""
+        index = {}
+        for size, items in (data or {}).items():
+            items = items or []
+            by_bg: dict[str, list[int]] = {}
+            for i, it in enumerate(items):
+                by_bg.setdefault(it.get("background_label", ""), []).append(i)
+            short_names = [it.get("name", "").split(" — ", 1)[0] for it in items]
+            index[size] = (short_names, by_bg)
+        return index
 
 
     def set_data(self, source: str, data: dict):
@@ -776,7 +969,9 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         Receive and cache available poster data for a given source.
         """
         self._data_cache[source] = data or {}
+        self._scan_completed[source] = True
 
+        # Always hashed: the same dict may come back edited in place
         sig = self._data_signature(data or {})
         if self._avail_sig.get(source) == sig:
             if source == self._source:
@@ -784,9 +979,9 @@ class PrintManagerViewQt(QtWidgets.QFrame):
             return
 
         self._avail_sig[source] = sig
+        self._filter_index[source] = self._build_filter_index(self._data_cache[source])
 
-        tree = self._tree_for_source(source)
-        self._populate_tree(tree, self._data_cache.get(source) or {})
+        self._populate_tree(source)
 
         if source == self._source:
             self._apply_source_to_stack(source)
@@ -798,57 +993,51 @@ class PrintManagerViewQt(QtWidgets.QFrame):
     # =================================================
 
     def set_queue(self, items: List[dict]):
-        self.list_queue.clear()
+        rows: list[list[dict]] = []
 
-        used = set()
-        first = True
-
-        for i, it in enumerate(items):
-            if i in used:
-                continue
+        # Row holding an unpaired 12x18 waiting for its partner. The pair keeps
+        # the first item's position; anything in between follows it.
+        pending: list[dict] | None = None
 
+        for it in items:
             # ---- 12x18 pairing (2-UP) ----
             if it.get("size") == PRINT_SIZES[0]:  # "12x18"
-                pair_idx = None
-                for j in range(i + 1, len(items)):
-                    if j not in used and items[j].get("size") == PRINT_SIZES[0]:
-                        pair_idx = j
-                        break
-
-                if pair_idx is not None:
-                    used.update({i, pair_idx})
-                    frame = self._build_pair_frame([it, items[pair_idx]], first)
-                    li = QtWidgets.QListWidgetItem()
-                    li.setData(QtCore.Qt.UserRole, [it, items[pair_idx]])
-                    li.setSizeHint(frame.sizeHint())
-                    self.list_queue.addItem(li)
-                    self.list_queue.setItemWidget(li, frame)
-                    first = False
-                    continue
+                if pending is None:
+                    pending = [it]
+                    rows.append(pending)
+                else:
+                    pending.append(it)
+                    pending = None
+                continue
 
             # ---- Single job ----
-            used.add(i)
-            frame = self._build_single_frame(it, first)
-            li = QtWidgets.QListWidgetItem()
-            li.setData(QtCore.Qt.UserRole, [it])
-            li.setSizeHint(frame.sizeHint())
-            self.list_queue.addItem(li)
-            self.list_queue.setItemWidget(li, frame)
-            first = False
-
-        self._sync_queue_row_selection_props()
+            rows.append([it])
+
+        # One model reset for the whole queue; the delegate paints every row
+        self._queue_delegate.invalidate_colors()
+        self.list_queue.set_rows(rows)
+
     # =================================================
     # Frame Builders (delegated to shared module)
     # =================================================
 
+    @property
+    def _queue_rows(self) -> QueueRowFactory:
+        if self._queue_rows_factory is None:
+            self._queue_rows_factory = QueueRowFactory(
+                badge_width=self.BADGE_WIDTH,
+                indicator_width=self.INDICATOR_WIDTH,
+            )
+        return self._queue_rows_factory
+
     def _base_row_frame(self, *, variant: str) -> QtWidgets.QFrame:
         return self._queue_rows.base_row_frame(variant=variant)
 
     def _build_pair_frame(self, pair: List[dict], first: bool) -> QtWidgets.QFrame:
         return self._queue_rows.build_pair_frame(pair)
 
-    def _build_single_frame(self, it: dict, first: bool) -> QtWidgets.QFrame:
-        return self._queue_rows.build_single_frame(it)
+    def _build_single_frame(self, items: List[dict], first: bool) -> QtWidgets.QFrame:
+        return self._queue_rows.build_single_frame(items[0])
 
     def _build_badge(self, text: str, *, variant: str) -> QtWidgets.QLabel:
         return self._queue_rows.build_badge(text, variant=variant)
@@ -857,39 +1046,66 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         return self._queue_rows.build_indicator()
 
 
-    # =================================================
-    # Selection syncing
-    # =================================================
-
-    def _sync_queue_row_selection_props(self) -> None:
-        for i in range(self.list_queue.count()):
-            item = self.list_queue.item(i)
-            widget = self.list_queue.itemWidget(item)
-            if not widget:
-                continue
-
-            widget.setProperty("selected", bool(item.isSelected()))
-            repolish(widget)
-
     # =================================================
     # Internals
     # =================================================
 
     def _apply_source_to_stack(self, source: str):
-        if source == "archive":
-            self.available_stack.setCurrentWidget(self.tree_archive)
-        else:
-            self.available_stack.setCurrentWidget(self.tree_studio)
+        model = self._model_for_source(source)
+        tree = self.tree_available
+        if tree.model() is model:
+            return
+
+        # setModel() creates a fresh selection model and leaves the old one alive
+        old_selection = tree.selectionModel()
+        tree.setModel(model)
+        if old_selection is not None:
+            old_selection.deleteLater()
 
 
     def _refresh_current_tree(self):
-        tree = self._current_available_tree()
-        data = self._data_cache.get(self._source) or {}
-        
-        if hasattr(self, '_current_bg_filter') and self._source == "archive" and self._current_bg_filter:
-            self._populate_tree_with_filter(tree, data, self._current_bg_filter)
+        """Coalesce source/size/filter changes into one tree rebuild per event-loop tick."""
+        if self._refresh_pending:
+            return
+        self._refresh_pending = True
+        QtCore.QTimer.singleShot(0, self._flush_refresh)
+
+    @QtCore.Slot()
+    def _flush_refresh(self) -> None:
+        if not self._refresh_pending:
+            return
+        self._refresh_pending = False
+        self._do_refresh_current_tree()
+
+    def _do_refresh_current_tree(self):
+        if self._source == "archive" and self._current_bg_filter:
+            self._populate_tree_with_filter(self._source, self._current_bg_filter)
         else:
-            self._populate_tree(tree, data)
+            self._populate_tree(self._source)
+
+    # -------------------------------------------------
+    # Toggle slots (bound methods, not per-button lambdas)
+    # -------------------------------------------------
+
+    @QtCore.Slot()
+    def _on_source_archive(self) -> None:
+        self._set_source("archive")
+
+    @QtCore.Slot()
+    def _on_source_studio(self) -> None:
+        self._set_source("studio")
+
+    @QtCore.Slot()
+    def _on_size_12x18(self) -> None:
+        self._set_size(PRINT_SIZES[0])
+
+    @QtCore.Slot()
+    def _on_size_18x24(self) -> None:
+        self._set_size(PRINT_SIZES[1])
+
+    @QtCore.Slot()
+    def _on_size_24x36(self) -> None:
+        self._set_size(PRINT_SIZES[2])
 
 
     def _set_size(self, size: str):
@@ -923,7 +1139,7 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         self._update_background_selector(source)
         self._apply_source_to_stack(source)
 
-        if not self._data_cache.get(source):
+        if not self._scan_completed.get(source):
             self.rescan_requested.emit()
 
         self._refresh_current_tree()
@@ -932,17 +1148,17 @@ class PrintManagerViewQt(QtWidgets.QFrame):
             self.source_changed.emit(source)
 
 
-    def _current_available_tree(self) -> QtWidgets.QTreeWidget:
-        return self._tree_for_source(self._source)
+    def _current_available_tree(self) -> QtWidgets.QTreeView:
+        return self.tree_available
     
 
     def _emit_add_selected(self):
         tree = self._current_available_tree()
-        items = []
-        for it in tree.selectedItems():
-            data = it.data(0, QtCore.Qt.UserRole)
-            if data:
-                items.append(data)
+        items = [
+            data
+            for index in tree.selectionModel().selectedRows()
+            if (data := index.data(QtCore.Qt.UserRole))
+        ]
 
         if items:
             self.queue_add_requested.emit(items)
@@ -956,10 +1172,8 @@ class PrintManagerViewQt(QtWidgets.QFrame):
         Build a queue-style row frame for read-only preview usage.
         - items: list of 1 (single) or 2 (pair) item dicts
         """
-        if len(items) == 2:
-            frame = self._build_pair_frame(items, first=False)
-        else:
-            frame = self._build_single_frame(items[0], first=False)
+        build = self._build_pair_frame if len(items) == 2 else self._build_single_frame
+        frame = build(items, first=False)
 
         frame.setCursor(QtCore.Qt.PointingHandCursor)
         return frame
\ No newline at end of file